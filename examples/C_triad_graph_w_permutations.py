@@ -1,6 +1,5 @@
 """Example of chord graph creation."""
 
-import itertools
 from music21.scale import MajorScale
 from networkx import connected_components
 from numpy import inf
@@ -12,16 +11,13 @@ from orbichord.identify import chordPitchNames
 from orbichord.symbol import chordSymbolFigure
 
 
-def combinator(iterable, dimension):
-    return itertools.product(iterable, repeat = dimension)
-
 scale = MajorScale('C')
 
 chord_generator = Generator(
     pitches = scale.getPitches('C','B'),
-    combinator = combinator,
     identify = chordPitchNames,
-    select = lambda chord: chord.isTriad()
+    select = lambda chord: chord.isTriad(),
+    ordered = True
 )
 
 max_norm_vl = EfficientVoiceLeading(
@@ -0,0 +1,391 @@
+"""Store generated chord spaces on disk."""
+
+import gzip
+import hashlib
+import heapq
+import json
+from music21.chord import Chord
+from music21.pitch import Pitch
+from orbichord.maps import MAPS_PATH
+import os
+import pickle
+from orbichord.chord import CompactChord, IdentifiedChord
+from typing import Callable, Iterable, Iterator
+
+
+def version() -> str:
+    """Return orbichord version or unknown if not available."""
+    try:
+        from pbr.version import VersionInfo
+        return VersionInfo('orbichord').release_string()
+    except Exception:
+        return 'unknown'
+
+
+def mapsDigest() -> str:
+    """Return a digest of the content of the orbichord maps."""
+    with open(MAPS_PATH, 'rb') as file:
+        return hashlib.sha256(file.read()).hexdigest()
+
+
+def functionName(function: Callable) -> str:
+    """Return the qualified name of a function.
+
+    Parameters
+    ----------
+        function : Callable
+            A module level function or class.
+
+    Return
+    ------
+        str
+            Module and qualified function name.
+
+    Raises
+    ------
+        ValueError
+            if the function has no stable name (e.g. lambda functions).
+    """
+    if function is None:
+        return None
+    module = getattr(function, '__module__', None)
+    qualname = getattr(function, '__qualname__', None)
+    if module is None or qualname is None or '<' in qualname:
+        raise ValueError(
+            'Function {} has no stable name.'.format(function)
+        )
+    return '{}.{}'.format(module, qualname)
+
+
+def fingerprint(
+    pitches: list,
+    dimension: int,
+    combinator: Callable,
+    identify: Callable,
+    select: Callable,
+    canonical: bool = False,
+    batch_select: Callable = None
+) -> str:
+    """Compute a stable fingerprint of a chord space.
+
+    The fingerprint depends on the generator arguments,
+    the orbichord version and the content of orbichord maps.
+
+    Parameters
+    ----------
+        pitches : list
+            List of music21.pitch.Pitch.
+        dimension : int
+            Dimension of the space.
+        combinator : Callable[[Iterable, int], Iterator]
+            Iterator function to generate all chord combinations.
+        identify : Callable[Chord, str]
+            Funtion to indentify chords.
+        select : Callable[Chord, str]
+            Function to select chords.
+        canonical : bool, optional
+            Canonical orbits are enumerated.
+        batch_select : Callable[[numpy.ndarray], numpy.ndarray], optional
+            Function to select batches of chords.
+
+    Return
+    ------
+        str
+            Hexadecimal digest of the chord space.
+    """
+    key = json.dumps([
+        [pitch.nameWithOctave for pitch in pitches],
+        dimension,
+        functionName(combinator),
+        functionName(identify),
+        functionName(select),
+        canonical,
+        functionName(batch_select),
+        version(),
+        mapsDigest()
+    ])
+    return hashlib.sha256(key.encode('utf-8')).hexdigest()
+
+
+def _pitchNames(chord: Chord) -> Iterator[str]:
+    """Return the pitch names with octave of a chord."""
+    if isinstance(chord, CompactChord):
+        return map(
+            lambda item: '{}{}'.format(*item),
+            zip(chord.pitchNames, chord.octaves)
+        )
+    return (pitch.nameWithOctave for pitch in chord.pitches)
+
+
+def _readChord(
+    names: list,
+    identify: Callable[[Chord], str],
+    compact: bool = False
+) -> Chord:
+    """Create a chord from pitch names with octave."""
+    if not compact:
+        return IdentifiedChord(identify = identify, notes = names)
+    pitches = tuple(Pitch(name) for name in names)
+    return CompactChord(
+        pitches = pitches,
+        octaves = tuple(pitch.octave for pitch in pitches),
+        identify = identify
+    )
+
+
+def writeChords(path: str, chords: Iterable[Chord]) -> Iterator[Chord]:
+    """Write chords to a file while iterating over them.
+
+    The file is written with one chord per line with pitch names and octaves,
+    and it is compressed using gzip. The file is only created once all
+    chords are iterated.
+
+    Parameters
+    ----------
+        path : str
+            Path of the file.
+        chords : Iterable[Chord]
+            Chords to be written.
+
+    Yields
+    ------
+        Chord
+            The chords being written.
+    """
+    temporary = '{}.{}.tmp'.format(path, os.getpid())
+    try:
+        with gzip.open(temporary, 'wt') as file:
+            for chord in chords:
+                file.write(' '.join(_pitchNames(chord)) + '\n')
+                yield chord
+        os.replace(temporary, path)
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+
+def readChords(
+    path: str,
+    identify: Callable[[Chord], str],
+    compact: bool = False
+) -> Iterator[Chord]:
+    """Read chords from a file.
+
+    Parameters
+    ----------
+        path : str
+            Path of the file.
+        identify : Callable[Chord, str]
+            Funtion to indentify chords.
+        compact : bool, optional
+            Read compact chords.
+
+    Yields
+    ------
+        Chord
+            The chords in the file.
+    """
+    with gzip.open(path, 'rt') as file:
+        for line in file:
+            yield _readChord(line.split(), identify, compact)
+
+
+def writeChunk(directory: str, index: int, chords: Iterable[Chord]):
+    """Write a chunk of chords.
+
+    Parameters
+    ----------
+        directory : str
+            Directory of the chunk files.
+        index : int
+            Chunk index.
+        chords : Iterable[Chord]
+            Chords to be written.
+    """
+    path = os.path.join(directory, 'chunk-{:06d}.chords.gz'.format(index))
+    for _ in writeChords(path, chords):
+        pass
+
+
+def readChunks(
+    directory: str,
+    identify: Callable[[Chord], str],
+    compact: bool = False
+) -> Iterator[Chord]:
+    """Read the chords of all chunks in order.
+
+    Parameters
+    ----------
+        directory : str
+            Directory of the chunk files.
+        identify : Callable[Chord, str]
+            Funtion to indentify chords.
+        compact : bool, optional
+            Read compact chords.
+
+    Yields
+    ------
+        Chord
+            The chords in the chunks.
+    """
+    names = sorted(
+        name for name in os.listdir(directory)
+        if name.startswith('chunk-') and name.endswith('.chords.gz')
+    )
+    for name in names:
+        yield from readChords(
+            os.path.join(directory, name), identify, compact
+        )
+
+
+def writeCheckpoint(directory: str, state: dict):
+    """Write atomically a checkpoint.
+
+    Parameters
+    ----------
+        directory : str
+            Directory of the checkpoint.
+        state : dict
+            Checkpoint state.
+    """
+    path = os.path.join(directory, 'checkpoint.pickle')
+    temporary = '{}.{}.tmp'.format(path, os.getpid())
+    with open(temporary, 'wb') as file:
+        pickle.dump(state, file)
+    os.replace(temporary, path)
+
+
+def readCheckpoint(directory: str) -> dict:
+    """Read a checkpoint.
+
+    Parameters
+    ----------
+        directory : str
+            Directory of the checkpoint.
+
+    Return
+    ------
+        dict
+            Checkpoint state or None if there is no checkpoint.
+    """
+    path = os.path.join(directory, 'checkpoint.pickle')
+    if not os.path.exists(path):
+        return None
+    with open(path, 'rb') as file:
+        return pickle.load(file)
+
+
+def writeShard(path: str, entries: Iterable[tuple]):
+    """Write the chords of a generator shard.
+
+    The file is written with one chord per line with the position of the
+    chord in the generator, a flag that is 1 if the chord is selected, and
+    the pitch names and octaves. It is compressed using gzip and only
+    created once all entries are written.
+
+    Parameters
+    ----------
+        path : str
+            Path of the file.
+        entries : Iterable[tuple]
+            Tuples of position, chord and true if the chord is selected,
+            sorted by position.
+    """
+    temporary = '{}.{}.tmp'.format(path, os.getpid())
+    try:
+        with gzip.open(temporary, 'wt') as file:
+            for position, chord, selected in entries:
+                file.write('{} {} {}\n'.format(
+                    position, int(selected), ' '.join(_pitchNames(chord))
+                ))
+        os.replace(temporary, path)
+    finally:
+        if os.path.exists(temporary):
+            os.remove(temporary)
+
+
+def readShard(
+    path: str,
+    identify: Callable[[Chord], str],
+    compact: bool = False
+) -> Iterator[tuple]:
+    """Read the chords of a generator shard.
+
+    Parameters
+    ----------
+        path : str
+            Path of the file.
+        identify : Callable[Chord, str]
+            Funtion to indentify chords.
+        compact : bool, optional
+            Read compact chords.
+
+    Yields
+    ------
+        tuple
+            Position, chord and true if the chord is selected.
+    """
+    with gzip.open(path, 'rt') as file:
+        for line in file:
+            position, selected, *names = line.split()
+            yield (
+                int(position),
+                _readChord(names, identify, compact),
+                selected == '1'
+            )
+
+
+def mergeShards(
+    paths: Iterable[str],
+    identify: Callable[[Chord], str],
+    compact: bool = False
+) -> Iterator[Chord]:
+    """Merge the chords of generator shards.
+
+    The shards are merged by position keeping the first occurrence of each
+    chord identity, so the chords are the same and in the same order as the
+    ones of the generator without shards (see Generator.write_shard).
+
+    Parameters
+    ----------
+        paths : Iterable[str]
+            Paths of the shard files.
+        identify : Callable[Chord, str]
+            Funtion to indentify chords.
+        compact : bool, optional
+            Read compact chords.
+
+    Yields
+    ------
+        Chord
+            The selected chords of all the shards.
+
+    Examples
+    --------
+    >>> import os, tempfile
+    >>> from orbichord.cache import mergeShards
+    >>> from orbichord.generator import Generator
+    >>> from orbichord.identify import chordOrderedPitchClasses
+    >>> from music21.scale import MajorScale
+    >>> directory = tempfile.mkdtemp()
+    >>> paths = [os.path.join(directory, str(i)) for i in range(3)]
+    >>> for index, path in enumerate(paths):
+    ...     Generator(
+    ...         pitches = MajorScale('C').getPitches('C','B'),
+    ...         shard = (index, 3)
+    ...     ).write_shard(path)
+    >>> chords = list(mergeShards(paths, chordOrderedPitchClasses))
+    >>> len(chords)
+    27
+    """
+    vetoed_identities = set()
+    entries = heapq.merge(
+        *(readShard(path, identify, compact) for path in paths),
+        key = lambda entry: entry[0]
+    )
+    for _, chord, selected in entries:
+        if chord.identity in vetoed_identities:
+            continue
+        vetoed_identities.add(chord.identity)
+        if selected:
+            yield chord
@@ -1,14 +1,26 @@
 """Implement identified chords."""
 
+from collections import OrderedDict
+import copy
 from music21.chord import Chord
+from music21.pitch import Pitch
+from orbichord.identify import \
+    chordOrderedPitchClasses, \
+    identityDigest, \
+    pitchClassesString
 from typing import Callable
+import weakref
 
 
 class IdentifiedChord(Chord):
     """Extend Chord to be a hashable object.
 
     The hash is contructed from a identity function that
-    map a chord in to a string.
+    map a chord in to a string. The identity is computed once and stored
+    until the chord is modified through the chord methods (e.g. add,
+    remove, setting items or pitches) or its cache is cleared. As for the
+    music21 chord caches, modifying in place the notes or pitches of the
+    chord is not supported, call clearCache after doing so.
 
     Parameters
     ----------
@@ -34,24 +46,465 @@ class IdentifiedChord(Chord):
     """
 
     def __init__(self,
-        identify : Callable[[Chord], str] = \
-            lambda chord: chord.orderedPitchClassesString,
+        identify : Callable[[Chord], str] = chordOrderedPitchClasses,
         notes=None,
         **keywords
     ):
         """Constructor"""
+        self._identity = None
         super().__init__(notes, **keywords)
         self._identify = identify
 
     def __hash__(self):
         """Return a has of the string."""
-        return hash(self._identify(self))
+        return hash(self.identity)
+
+    def __setitem__(self, key, value):
+        """Set a chord component and clear the cached identity."""
+        super().__setitem__(key, value)
+        self.clearCache()
+
+    def add(self, notes, **keywords):
+        """Add notes to the chord and clear the cached identity."""
+        super().add(notes, **keywords)
+        self.clearCache()
+
+    def remove(self, removeItem):
+        """Remove a note from the chord and clear the cached identity."""
+        super().remove(removeItem)
+        self.clearCache()
+
+    @property
+    def pitches(self):
+        """Return the chord pitches."""
+        return Chord.pitches.fget(self)
+
+    @pitches.setter
+    def pitches(self, value):
+        """Set the chord pitches and clear the cached identity."""
+        Chord.pitches.fset(self, value)
+        self.clearCache()
+
+    def clearCache(self, **keywords):
+        """Clear the music21 caches and the cached identity."""
+        super().clearCache(**keywords)
+        self._identity = None
+
+    def __eq__(self, other):
+        """Compare chords by their identity."""
+        if not isinstance(
+            other, (ChordValue, CompactChord, IdentifiedChord)
+        ):
+            return False
+        return self.identity == other.identity
+
+    @property
+    def identify(self):
+        """Return identify function."""
+        return self._identify
+
+    @property
+    def identity(self):
+        """Return identity string."""
+        if self._identity is None:
+            self._identity = self._identify(self)
+        return self._identity
+
+    @property
+    def digest(self):
+        """Return the deterministic digest of the identity."""
+        return identityDigest(self.identity)
+
+
+class EqualDivisionPitch:
+    """Pitch of an equal division of the octave.
+
+    The pitch is an integer step where each octave has a given number of
+    divisions, and the step zero is the pitch class zero of octave zero.
+    It provides the pitch attributes used by orbichord generators.
+
+    Parameters
+    ----------
+        step : int
+            Pitch step.
+        divisions : int, optional
+            Number of divisions of the octave.
+
+    Examples
+    --------
+    >>> from orbichord.chord import EqualDivisionPitch
+    >>> pitch = EqualDivisionPitch(100, 24)
+    >>> pitch.pitchClass, pitch.octave, pitch.name, pitch.nameWithOctave
+    (4, 4, '4', '4/24:4')
+    >>> pitch.toPitch()
+    <music21.pitch.Pitch D4>
+    """
+
+    __slots__ = ('_step', '_divisions')
+
+    def __init__(self, step: int, divisions: int = 12):
+        """Constructor"""
+        self._step = step
+        self._divisions = divisions
+
+    def __repr__(self):
+        """Return a representation of the pitch."""
+        return '<{}.{} {}>'.format(
+            self.__module__,
+            self.__class__.__name__,
+            self.nameWithOctave
+        )
+
+    @property
+    def step(self):
+        """Return the pitch step."""
+        return self._step
+
+    @property
+    def divisions(self):
+        """Return the number of divisions of the octave."""
+        return self._divisions
+
+    @property
+    def pitchClass(self):
+        """Return the pitch class."""
+        return self._step % self._divisions
+
+    @property
+    def octave(self):
+        """Return the pitch octave."""
+        return self._step // self._divisions
+
+    @property
+    def name(self):
+        """Return the pitch name as its pitch class."""
+        return str(self.pitchClass)
+
+    @property
+    def nameWithOctave(self):
+        """Return the pitch name with divisions and octave."""
+        return '{}/{}:{}'.format(
+            self.pitchClass, self._divisions, self.octave
+        )
+
+    def toPitch(self, octave: int = None) -> Pitch:
+        """Return the closest music21 pitch.
+
+        Parameters
+        ----------
+            octave : int, optional
+                Pitch octave, by default the octave of the step.
+
+        Return
+        ------
+            Pitch
+                Pitch with the same pitch space value (it could be a
+                microtone or be rounded for some divisions of the octave).
+        """
+        if octave is None:
+            octave = self.octave
+        pitch = Pitch()
+        pitch.ps = 12*(octave + 1) + 12*self.pitchClass/self._divisions
+        return pitch
+
+
+class CompactChord:
+    """Lightweight chord defined by pitch indexes and octaves.
+
+    The chord keeps references to the pitches used to create it, and
+    the octave and pitch class of each of its pitches as plain integers.
+    The identity is computed once at construction. Built-in identify
+    and select functions only need the pitch classes and names, therefore
+    the music21 chord is only created when any other chord attribute
+    is requested.
+
+    Chords of pitches of other equal divisions of the octave are defined
+    using orbichord.chord.EqualDivisionPitch.
+
+    Parameters
+    ----------
+        pitches : tuple
+            Tuple of music21.pitch.Pitch to define the chord pitch spelling.
+        octaves : tuple
+            Tuple with the octave of each chord pitch.
+        identify : Callable[[Chord], str], optional
+            Funtion to indentify chords.
+        pitchClasses : tuple, optional
+            Tuple with the pitch class of each chord pitch.
+        divisions : int, optional
+            Number of divisions of the octave.
+
+    Examples
+    --------
+    >>> from music21.pitch import Pitch
+    >>> from orbichord.chord import CompactChord
+    >>> C = CompactChord(
+    ...     pitches = (Pitch('C'), Pitch('E'), Pitch('G')),
+    ...     octaves = (0, 0, 0)
+    ... )
+    >>> print(C.identity)
+    <047>
+    >>> C.isTriad()
+    True
+    >>> C.chord
+    <orbichord.chord.IdentifiedChord C0 E0 G0>
+    """
+
+    __slots__ = (
+        '_pitches', '_octaves', '_pitchClasses', '_divisions',
+        '_identify', '_identity', '_chord', '__weakref__'
+    )
+
+    def __init__(self,
+        pitches: tuple,
+        octaves: tuple,
+        identify: Callable[[Chord], str] = chordOrderedPitchClasses,
+        pitchClasses: tuple = None,
+        divisions: int = 12
+    ):
+        """Constructor"""
+        if pitchClasses is None:
+            pitchClasses = tuple(pitch.pitchClass for pitch in pitches)
+        self._pitches = pitches
+        self._octaves = octaves
+        self._pitchClasses = pitchClasses
+        self._divisions = divisions
+        self._identify = identify
+        self._chord = None
+        self._identity = identify(self)
+
+    def __reduce__(self):
+        """Return the arguments to pickle the chord without music21 chord."""
+        return self.__class__, (
+            self._pitches, self._octaves, self._identify,
+            self._pitchClasses, self._divisions
+        )
+
+    def __getattr__(self, name):
+        """Delegate any other attribute to the music21 chord."""
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.chord, name)
+
+    def __hash__(self):
+        """Return a has of the identity."""
+        return hash(self._identity)
+
+    def __eq__(self, other):
+        """Compare chords by their identity."""
+        if not isinstance(
+            other, (ChordValue, CompactChord, IdentifiedChord)
+        ):
+            return False
+        return self.identity == other.identity
+
+    def __repr__(self):
+        """Return a representation without creating the chord."""
+        return '<{}.{} {}>'.format(
+            self.__module__,
+            self.__class__.__name__,
+            ' '.join(map(
+                lambda item: '{}{}'.format(item[0].name, item[1]),
+                zip(self._pitches, self._octaves)
+            ))
+        )
+
+    @property
+    def identify(self):
+        """Return identify function."""
+        return self._identify
+
+    @property
+    def identity(self):
+        """Return identity string."""
+        return self._identity
+
+    @property
+    def digest(self):
+        """Return the deterministic digest of the identity."""
+        return identityDigest(self._identity)
+
+    @property
+    def octaves(self):
+        """Return the octave of each chord pitch."""
+        return self._octaves
+
+    @property
+    def pitchClasses(self):
+        """Return the pitch class of each chord pitch."""
+        return self._pitchClasses
+
+    @property
+    def divisions(self):
+        """Return the number of divisions of the octave."""
+        return self._divisions
+
+    @property
+    def pitchNames(self):
+        """Return the name of each chord pitch."""
+        return [pitch.name for pitch in self._pitches]
+
+    @property
+    def orderedPitchClassesString(self):
+        """Return a string with the sorted unique pitch classes."""
+        pcs = sorted(set(self._pitchClasses))
+        return pitchClassesString(pcs, self._divisions)
+
+    @property
+    def chord(self):
+        """Return the music21 chord, creating it on first use."""
+        if self._chord is None:
+            pitches = []
+            for pitch, octave in zip(self._pitches, self._octaves):
+                if isinstance(pitch, EqualDivisionPitch):
+                    pitch = pitch.toPitch(octave)
+                else:
+                    pitch = copy.deepcopy(pitch)
+                    pitch.octave = octave
+                pitches.append(pitch)
+            self._chord = IdentifiedChord(
+                identify = self._identify,
+                notes = pitches
+            )
+        return self._chord
+
+
+class ChordValue:
+    """Immutable chord value defined by integer pitch classes and octaves.
+
+    The chord only keeps tuples of integers and its identify function,
+    and it is much lighter and faster to create than a music21 chord.
+    The identity is computed when first needed. Built-in identify, symbol
+    and chordinate functions only need the pitch classes and names, and
+    any other attribute is delegated to a music21 chord created on each
+    request (see toChord). Pitches are spelled as music21 spells pitch
+    classes by default.
+
+    Parameters
+    ----------
+        pitchClasses : tuple
+            Tuple with the pitch class of each chord pitch.
+        octaves : tuple, optional
+            Tuple with the octave of each chord pitch, by default 4.
+        identify : Callable[[Chord], str], optional
+            Funtion to indentify chords.
+        divisions : int, optional
+            Number of divisions of the octave.
+
+    Examples
+    --------
+    >>> from orbichord.chord import ChordValue
+    >>> C = ChordValue((0, 4, 7), (4, 4, 4))
+    >>> print(C.identity)
+    <047>
+    >>> C.pitchNames
+    ['C', 'E', 'G']
+    >>> C.isTriad()
+    True
+    >>> C.toChord()
+    <orbichord.chord.IdentifiedChord C4 E4 G4>
+    """
+
+    __slots__ = (
+        '_pitchClasses', '_octaves', '_divisions', '_identify', '_identity',
+        '__weakref__'
+    )
+
+    def __init__(self,
+        pitchClasses: tuple,
+        octaves: tuple = None,
+        identify: Callable[[Chord], str] = chordOrderedPitchClasses,
+        divisions: int = 12
+    ):
+        """Constructor"""
+        pitchClasses = tuple(pitchClasses)
+        if octaves is None:
+            octaves = (4,)*len(pitchClasses)
+        octaves = tuple(octaves)
+        if len(octaves) != len(pitchClasses):
+            raise ValueError(
+                'The number of octaves and pitch classes has to be the same.'
+            )
+        setattr = object.__setattr__
+        setattr(self, '_pitchClasses', pitchClasses)
+        setattr(self, '_octaves', octaves)
+        setattr(self, '_divisions', divisions)
+        setattr(self, '_identify', identify)
+        setattr(self, '_identity', None)
+
+    @classmethod
+    def fromChord(cls,
+        chord: Chord,
+        identify: Callable[[Chord], str] = None
+    ) -> 'ChordValue':
+        """Create a chord value from a chord.
+
+        Parameters
+        ----------
+            chord : Chord
+                A music21, identified or compact chord.
+            identify : Callable[[Chord], str], optional
+                Funtion to indentify chords, by default the one of the
+                chord or chordOrderedPitchClasses.
+
+        Return
+        ------
+            ChordValue
+                The chord value.
+        """
+        if identify is None:
+            identify = getattr(chord, 'identify', chordOrderedPitchClasses)
+        octaves = getattr(chord, 'octaves', None)
+        if octaves is None:
+            octaves = (pitch.octave for pitch in chord.pitches)
+        return cls(
+            chord.pitchClasses, octaves, identify,
+            getattr(chord, 'divisions', 12)
+        )
+
+    def __setattr__(self, name, value):
+        """Forbid modifications."""
+        raise AttributeError('ChordValue is immutable.')
+
+    def __reduce__(self):
+        """Return the arguments to pickle the chord."""
+        return self.__class__, (
+            self._pitchClasses, self._octaves,
+            self._identify, self._divisions
+        )
+
+    def __getattr__(self, name):
+        """Delegate any other attribute to a music21 chord."""
+        if name.startswith('_'):
+            raise AttributeError(name)
+        return getattr(self.toChord(), name)
+
+    def __len__(self):
+        """Return the number of pitches."""
+        return len(self._pitchClasses)
+
+    def __hash__(self):
+        """Return a has of the identity."""
+        return hash(self.identity)
 
     def __eq__(self, other):
-        """Overload comparison based hashable implementation."""
-        if not isinstance(other, IdentifiedChord):
+        """Compare chords by their identity."""
+        if not isinstance(
+            other, (ChordValue, CompactChord, IdentifiedChord)
+        ):
             return False
-        return hash(self) == hash(other)
+        return self.identity == other.identity
+
+    def __repr__(self):
+        """Return a representation without creating the chord."""
+        return '<{}.{} {}>'.format(
+            self.__module__,
+            self.__class__.__name__,
+            ' '.join(map(
+                lambda item: '{}{}'.format(*item),
+                zip(self.pitchNames, self._octaves)
+            ))
+        )
 
     @property
     def identify(self):
@@ -61,4 +514,178 @@ class IdentifiedChord(Chord):
     @property
     def identity(self):
         """Return identity string."""
-        return self._identify(self)
+        identity = self._identity
+        if identity is None:
+            identity = self._identify(self)
+            object.__setattr__(self, '_identity', identity)
+        return identity
+
+    @property
+    def digest(self):
+        """Return the deterministic digest of the identity."""
+        return identityDigest(self.identity)
+
+    @property
+    def octaves(self):
+        """Return the octave of each chord pitch."""
+        return self._octaves
+
+    @property
+    def pitchClasses(self):
+        """Return the pitch class of each chord pitch."""
+        return self._pitchClasses
+
+    @property
+    def divisions(self):
+        """Return the number of divisions of the octave."""
+        return self._divisions
+
+    @property
+    def multisetCardinality(self):
+        """Return the number of pitches."""
+        return len(self._pitchClasses)
+
+    @property
+    def pitchNames(self):
+        """Return the name of each chord pitch."""
+        if self._divisions != 12:
+            return [str(pc) for pc in self._pitchClasses]
+        return [_PITCH_CLASS_NAMES[pc] for pc in self._pitchClasses]
+
+    @property
+    def orderedPitchClassesString(self):
+        """Return a string with the sorted unique pitch classes."""
+        pcs = sorted(set(self._pitchClasses))
+        return pitchClassesString(pcs, self._divisions)
+
+    def removeRedundantPitchClasses(self, inPlace: bool = False):
+        """Return the chord without repeated pitch classes.
+
+        Parameters
+        ----------
+            inPlace : bool, optional
+                Only False is supported as chords are immutable.
+
+        Return
+        ------
+            ChordValue
+                Chord with the first occurrence of each pitch class.
+        """
+        if inPlace:
+            raise ValueError('ChordValue is immutable.')
+        pitch_classes = []
+        octaves = []
+        for pc, octave in zip(self._pitchClasses, self._octaves):
+            if pc in pitch_classes:
+                continue
+            pitch_classes.append(pc)
+            octaves.append(octave)
+        return ChordValue(
+            pitch_classes, octaves, self._identify, self._divisions
+        )
+
+    def toChord(self) -> IdentifiedChord:
+        """Create the music21 chord.
+
+        Return
+        ------
+            IdentifiedChord
+                A new chord with the same pitches and identify function.
+        """
+        pitches = []
+        for pc, octave in zip(self._pitchClasses, self._octaves):
+            if self._divisions != 12:
+                pitch = EqualDivisionPitch(pc, self._divisions).toPitch(octave)
+            else:
+                pitch = Pitch(_PITCH_CLASS_NAMES[pc], octave = octave)
+            pitches.append(pitch)
+        return IdentifiedChord(identify = self._identify, notes = pitches)
+
+
+class ChordRegistry:
+    """Registry of shared chord instances.
+
+    Chords are interned by their identify function and identity, so equal
+    chords are represented by the same instance and can be compared with
+    the is operator. The registry keeps weak references to the chords and
+    only the most recently interned chords are kept alive by the registry.
+    Interned chords are shared, so only immutable chord values and compact
+    chords are interned. The music21 chord of a shared compact chord is
+    shared too and must not be modified (copy it instead).
+
+    Parameters
+    ----------
+        maxsize : int, optional
+            Maximum number of recently interned chords kept alive.
+
+    Examples
+    --------
+    >>> from orbichord.chord import ChordRegistry, ChordValue
+    >>> registry = ChordRegistry()
+    >>> C = registry.intern(ChordValue((0, 4, 7)))
+    >>> registry.intern(ChordValue((7, 0, 4))) is C
+    True
+    """
+
+    def __init__(self, maxsize: int = 1024):
+        """Constructor."""
+        self._chords = weakref.WeakValueDictionary()
+        self._recent = OrderedDict()
+        self._maxsize = maxsize
+
+    def __contains__(self, chord: Chord) -> bool:
+        """Return true if a chord with the same identity is registered."""
+        return (chord.identify, chord.identity) in self._chords
+
+    def __len__(self) -> int:
+        """Return the number of registered chords."""
+        return len(self._chords)
+
+    @property
+    def maxsize(self):
+        """Return the maximum number of chords kept alive."""
+        return self._maxsize
+
+    def intern(self, chord: Chord) -> Chord:
+        """Return the registered chord with the same identity.
+
+        Parameters
+        ----------
+            chord : Chord
+                A compact chord or chord value.
+
+        Return
+        ------
+            Chord
+                The registered chord, or the given chord if there is
+                no chord registered with the same identity.
+
+        Raises
+        ------
+            TypeError
+                if the chord is not a compact chord or chord value.
+        """
+        if not isinstance(chord, (ChordValue, CompactChord)):
+            raise TypeError(
+                'Only compact chords and chord values can be interned.'
+            )
+        key = (chord.identify, chord.identity)
+        shared = self._chords.get(key)
+        if shared is None:
+            shared = chord
+            self._chords[key] = shared
+        recent = self._recent
+        recent[key] = shared
+        recent.move_to_end(key)
+        if len(recent) > self._maxsize:
+            recent.popitem(last = False)
+        return shared
+
+    def clear(self):
+        """Remove all the registered chords."""
+        self._chords.clear()
+        self._recent.clear()
+
+
+# Default music21 names of pitch classes
+_PITCH_CLASS_NAMES = tuple(Pitch(pc).name for pc in range(12))
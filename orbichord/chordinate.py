@@ -6,6 +6,7 @@ import math
 from music21.chord import Chord
 from music21.pitch import Pitch
 from music21.scale import ConcreteScale
+import numpy
 from numpy import array
 from typing import Callable
 
@@ -40,16 +41,53 @@ def scalePoint(
     """
     # Chordinates
     point = []
-    # Loop over pitches and extract scale
-    for pitch in chord.pitches:
+    # Loop over pitch classes and extract scale
+    for pc in chord.pitchClasses:
         point.append(
             scale.getScaleDegreeFromPitch(
-                pitch, comparisonAttribute='pitchClass'
+                Pitch(pc), comparisonAttribute='pitchClass'
             ) - 1
         )
     return point
 
 
+def scalePoints(
+    pcs: numpy.ndarray,
+    scale: ConcreteScale
+) -> numpy.ndarray:
+    """Compute the scale point of a batch of chords
+
+    Pitch classes that are not in the scale have degree -1.
+
+    Parameters
+    ----------
+        pcs : numpy.ndarray
+            Array of pitch classes with one chord per row.
+        scale : ConcreteScale
+            Scale use as metric step
+
+    Return
+    ------
+        numpy.ndarray
+            Array with the scalar point of each chord per row.
+
+    Examples
+    --------
+    >>> from music21.scale import MajorScale
+    >>> from orbichord.chordinate import scalePoints
+    >>> scale = MajorScale('C')
+    >>> scalePoints([[0, 4, 7], [9, 0, 4]], scale)
+    array([[0, 2, 4],
+           [5, 0, 2]])
+    """
+    degrees = numpy.array([
+        (scale.getScaleDegreeFromPitch(
+            Pitch(pc), comparisonAttribute='pitchClass'
+        ) or 0) - 1 for pc in range(12)
+    ])
+    return degrees[numpy.asarray(pcs, dtype=numpy.int64)]
+
+
 def standardSimplex(
     chord: Chord,
     scale: ConcreteScale,
@@ -120,6 +158,63 @@ def mod(x, y, d):
     return positive
 
 
+def euclideanNorm(delta: list) -> float:
+    """Compute the euclidean norm of a voice leading.
+
+    Named metrics are picklable, so voice leading objects using
+    them can be sent to other processes.
+
+    Parameters
+    ----------
+        delta : list
+            Voice leading scalar steps.
+
+    Return
+    ------
+        float
+            Square root of the sum of squared steps.
+    """
+    return float(numpy.linalg.norm(delta, 2))
+
+
+def taxicabNorm(delta: list) -> float:
+    """Compute the taxicab norm of a voice leading.
+
+    Parameters
+    ----------
+        delta : list
+            Voice leading scalar steps.
+
+    Return
+    ------
+        float
+            Sum of the absolute steps.
+    """
+    return float(numpy.linalg.norm(delta, 1))
+
+
+def maximumNorm(delta: list) -> float:
+    """Compute the maximum norm of a voice leading.
+
+    Parameters
+    ----------
+        delta : list
+            Voice leading scalar steps.
+
+    Return
+    ------
+        float
+            Largest absolute step.
+
+    Examples
+    --------
+    >>> from orbichord.chordinate import maximumNorm
+    >>> maximumNorm([-1, 2, 0])
+    2.0
+    """
+    return float(numpy.linalg.norm(delta, numpy.inf))
+
+
 class Permutation(Enum):
     """Define type permutation used interscalar matrix."""
     NONE = 1
@@ -1,13 +1,75 @@
 """Generate quotient space of n-pich classes."""
 
+import asyncio
+from collections import namedtuple
+from concurrent.futures import Executor, ProcessPoolExecutor
 import copy
-from itertools import combinations_with_replacement
+import itertools
+from itertools import combinations_with_replacement, count, islice
+import math
+import numpy
+import os
+from random import Random
+from statistics import NormalDist
+import threading
+import time
 from music21.chord import Chord
-from typing import Callable, Iterable, Iterator
-from orbichord.chord import IdentifiedChord
+from music21.scale import ConcreteScale
+from typing import AsyncIterator, Callable, Iterable, Iterator
+from orbichord.cache import \
+    fingerprint, \
+    readChords, \
+    readCheckpoint, \
+    writeChords, \
+    writeChunk, \
+    writeCheckpoint, \
+    writeShard
+from orbichord.chord import \
+    ChordRegistry, \
+    CompactChord, \
+    EqualDivisionPitch, \
+    IdentifiedChord
+from orbichord.chordinate import scalePoints
+from orbichord.identify import \
+    BATCH_IDENTITY_CODES, \
+    chordOrderedPitchClasses, \
+    chordPitchClassSetCode, \
+    TWELVE_DIVISION_IDENTITIES
+from orbichord.orbit import \
+    canonicalOrbits, \
+    multisetOrbitCount, \
+    orbitEnumeration, \
+    ORBIT_COUNTS, \
+    permutationOrbitCount, \
+    product, \
+    RANDOM_ORBITS, \
+    WEIGHTED_RANDOM_ORBITS
+from orbichord.store import identityStore, SpillStore
 from orbichord.symbol import hasChordSymbolFigure
 
 
+# Estimation of the number of chords with a confidence interval
+Estimate = namedtuple('Estimate', ['value', 'lower', 'upper', 'samples'])
+# Batch of chords stored as arrays with one chord per row
+ChordBatch = namedtuple(
+    'ChordBatch', ['pitchClasses', 'octaves', 'identities', 'scalePoints']
+)
+# Default maximum number of chords drawn per sampled chord
+SAMPLE_MAX_DRAWS_PER_CHORD = 10000
+# Report of number of chords drawn, selected and throughput of sampling
+SampleReport = namedtuple(
+    'SampleReport', ['drawn', 'selected', 'seconds', 'rate']
+)
+# Report of generation counters, seconds spent by stage and throughput
+GenerationReport = namedtuple(
+    'GenerationReport', [
+        'examined', 'vetoed', 'rejected', 'selected', 'total',
+        'combine_seconds', 'identify_seconds', 'select_seconds',
+        'seconds', 'rate', 'done'
+    ]
+)
+
+
 class Generator:
     """Generate the space of n-pitches chords.
 
@@ -20,6 +82,11 @@ class Generator:
 
     You can further restrict the generation of chords by passing a select
     function that restricts the type of chords yielded by the generator.
+    Chords can also be selected in batches by a vectorized function that
+    takes an array with the pitch classes of each chord per row, and returns
+    a boolean mask with the selected chords. When both are given, only the
+    chords selected by the batch select function are passed to the select
+    function.
 
     By default, the generator will produce 3-pitched chords with the same
     invariances as a pitch-class ser:
@@ -29,6 +96,86 @@ class Generator:
     Moreover, by default only chords with know symbols are selected to be
     generated.
 
+    Chords can also be made invariant under transposition (T) and inversion
+    (I) by identifying them by their orbit (e.g. orbichord.identify.chordOPTIC
+    or orbichord.identify.chordOPTC), whose labels are precomputed for
+    all the chords of a dimension (see orbichord.identify.orbitLabels).
+
+    For the built-in identities (see orbichord.identify) combined with
+    combinations with replacement, the generator can enumerate directly one
+    canonical representative per chord orbit instead of generating all the
+    combinations and vetoing the repeated ones. The chords generated are the
+    same and in the same order, but the work is proportional to the number
+    of chords in the space.
+
+    In ordered mode, the pitches are combined in ordered tuples (see
+    orbichord.orbit.product) so chords are not invariant under pitch class
+    permutation (P), and the distinct ordered chords are enumerated
+    directly as canonical orbits. Ordered identities (e.g.
+    orbichord.identify.chordPitchNames) yield every distinct voicing
+    without vetoing any chord.
+
+    In compact mode, the generator combines pitch indexes and fixes octaves
+    using integers, and it yields orbichord.chord.CompactChord objects
+    that only create the music21 chord when needed. In this mode, the
+    combinator is called with the range of pitch indexes instead of the
+    pitches themselves.
+
+    The generation can be split in shards that are identified and selected
+    in parallel by an executor, by default a process pool. The shards are
+    merged keeping the first occurence of each chord identity, so the
+    chords generated are the same and in the same order. When using a
+    process pool, the pitches, combinator, identify and select functions
+    have to be picklable (e.g. not lambda functions).
+
+    Repeated chords are vetoed by keeping a store of chord identities. The
+    identities of built-in identify functions are stored as integer codes
+    in a bitset when possible, or otherwise in a hash table of integers.
+    Other identities are stored in a python set. If a memory budget is
+    given, identities that do not fit in a bitset are stored in a store
+    that spills to disk when the budget is exceeded (see orbichord.store).
+
+    The number of chords in the space can be computed without generating
+    them for the spaces with canonical enumeration. If chords are selected,
+    the number of selected chords is estimated by drawing random chords.
+    Random chords can also be sampled directly from these spaces without
+    enumerating them.
+
+    Chords can also be generated in batches of arrays of pitch classes,
+    octaves, identities and scale points to be processed vectorized.
+
+    The generation can also be split across independent processes or
+    machines by giving each one a shard index and the number of shards. The
+    shards partition deterministically the combinator tuples by their
+    position, and each shard yields its own chords. The files written by
+    each shard (see write_shard) can be merged into the chords of the whole
+    space (see orbichord.cache.mergeShards).
+
+    The generation can be instrumented by passing a progress function, which
+    is called at most once per progress interval and when the generation
+    finishes, with a report of the number of tuples examined, chords vetoed
+    as repeated, rejected and selected, the total number of tuples if
+    known, and the seconds spent combining, identifying and selecting
+    chords. For compact chords, the identity computed at construction is
+    part of the combine stage. The instrumentation has no cost when there
+    is no progress function.
+
+    The generated compact chords can be interned in a registry of shared
+    chords (see orbichord.chord.ChordRegistry), so repeated generations
+    yield the same chord instances.
+
+    Batches can be generated asynchronously to be consumed by an asyncio
+    event loop without blocking it.
+
+    Long generations can be checkpointed to be resumed after interruptions.
+
+    Optionally, the generated chords can be cached on disk in a given
+    directory. The cache file is identified by a fingerprint of the pitches,
+    dimension, combinator, identify and select functions, the orbichord
+    version and the content of orbichord maps. When the file exists, the
+    chords are read from it instead of being generated. The combinator,
+    identify and select functions have to be module level functions.
+
     Parameters
     ----------
         pitches : list
@@ -41,11 +188,48 @@ class Generator:
             Funtion to indentify chords.
         select : Callable[Chord, str], optional
             Function to select chords.
+        canonical : bool, optional
+            Enumerate canonical orbit representatives.
+        compact : bool, optional
+            Generate compact chords using integer pitch classes and octaves.
+        workers : int, optional
+            Number of shards to generate in parallel.
+        executor : Executor, optional
+            Executor used to generate the shards, by default a process pool.
+        batch_select : Callable[[numpy.ndarray], numpy.ndarray], optional
+            Function to select batches of chords (see orbichord.selection).
+        batch_size : int, optional
+            Number of chords in each batch.
+        cache : str, optional
+            Directory where to cache the generated chords.
+        memory_budget : int, optional
+            Approximated maximum number of bytes used to veto chords.
+        ordered : bool, optional
+            Enumerate ordered chords directly (see orbichord.orbit.product).
+            The combinator has to be the default or a product combinator
+            (orbichord.orbit.product or itertools.product), and it is
+            replaced by orbichord.orbit.product.
+        shard : tuple, optional
+            Shard index and number of shards to generate.
+        progress : Callable[[GenerationReport], None], optional
+            Function called with the generation report.
+        progress_interval : float, optional
+            Minimum seconds between calls to the progress function.
+        registry : ChordRegistry, optional
+            Registry where to intern the generated chords, which have to
+            be compact.
 
     Raises
     ------
         ValueError
-            if the dimension is negative.
+            if the dimension is negative, if canonical enumeration is
+            requested and not available for the generator arguments, if
+            ordered generation is requested with a combinator other than
+            the default or a product, if
+            the shard is not valid or combined with workers or cache, if
+            progress is combined with workers, if a registry is given
+            without compact chords, or
+            if cache is requested and functions have no stable name.
 
     References
     ----------
@@ -86,26 +270,103 @@ class Generator:
         dimension: int = 3,
         combinator: Callable[[Iterable, int], Iterator] =\
             combinations_with_replacement,
-        identify: Callable[[Chord], str] = \
-            lambda chord: chord.orderedPitchClassesString,
-        select: Callable[[Chord], bool] = hasChordSymbolFigure
+        identify: Callable[[Chord], str] = chordOrderedPitchClasses,
+        select: Callable[[Chord], bool] = hasChordSymbolFigure,
+        canonical: bool = False,
+        compact: bool = False,
+        workers: int = None,
+        executor: Executor = None,
+        batch_select: Callable[[numpy.ndarray], numpy.ndarray] = None,
+        batch_size: int = 4096,
+        cache: str = None,
+        memory_budget: int = None,
+        ordered: bool = False,
+        shard: tuple = None,
+        progress: Callable[[GenerationReport], None] = None,
+        progress_interval: float = 1.0,
+        registry: ChordRegistry = None
     ):
         """Constructor."""
+        if ordered:
+            if combinator not in (
+                combinations_with_replacement, product, itertools.product
+            ):
+                raise ValueError(
+                    'Ordered generation combines pitches with '
+                    'orbichord.orbit.product, so the combinator has to be '
+                    'the default, orbichord.orbit.product or '
+                    'itertools.product.'
+                )
+            combinator = product
+            canonical = True
         # Sanity checks
         if dimension <= 0:
             raise ValueError('The dimension has to be larger than zero.')
+        if workers is not None and workers <= 0:
+            raise ValueError(
+                'The number of workers has to be larger than zero.'
+            )
+        if canonical:
+            canonicalOrbits(pitches, dimension, combinator, identify)
+        if shard is not None:
+            shard_index, shard_count = shard
+            if not 0 <= shard_index < shard_count:
+                raise ValueError(
+                    'The shard index has to be in [0, shard count).'
+                )
+            if workers or executor or cache is not None:
+                raise ValueError(
+                    'Shards cannot be combined with workers or cache.'
+                )
+        if progress is not None and (workers or executor):
+            raise ValueError('Progress cannot be combined with workers.')
+        if registry is not None and not compact:
+            raise ValueError('Only compact chords can be interned.')
         # Setting private values
         self._pitches = pitches
         self._dimension = dimension
         self._combinator = combinator
         self._identify = identify
         self._select = select
+        self._canonical = canonical
+        self._compact = compact
+        self._workers = workers
+        self._executor = executor
+        self._batch_select = batch_select
+        self._batch_size = batch_size
+        self._cache = cache
+        self._memory_budget = memory_budget
+        self._ordered = ordered
+        self._shard = shard
+        self._progress = progress
+        self._progress_interval = progress_interval
+        self._registry = registry
+        self._fingerprint = None
+        if cache is not None:
+            self._fingerprint = fingerprint(
+                pitches, dimension, combinator,
+                identify, select, canonical, batch_select
+            )
+        if compact:
+            self._pitch_values = self._values()
+
+    def __getstate__(self):
+        """Return the state to pickle without the executor and registry."""
+        state = self.__dict__.copy()
+        state['_executor'] = None
+        state['_registry'] = None
+        return state
 
     @property
     def pitches(self):
         """Return the generator pitches."""
         return self._pitches
 
+    @property
+    def divisions(self):
+        """Return the number of divisions of the octave."""
+        return 12
+
     @property
     def dimension(self):
         """Return the generator dimension."""
@@ -126,6 +387,71 @@ class Generator:
         """Return function to select chords."""
         return self._select
 
+    @property
+    def canonical(self):
+        """Return true if canonical orbits are enumerated."""
+        return self._canonical
+
+    @property
+    def ordered(self):
+        """Return true if ordered chords are enumerated."""
+        return self._ordered
+
+    @property
+    def shard(self):
+        """Return the generator shard index and count."""
+        return self._shard
+
+    @property
+    def progress(self):
+        """Return the generator progress function."""
+        return self._progress
+
+    @property
+    def progress_interval(self):
+        """Return the minimum seconds between progress reports."""
+        return self._progress_interval
+
+    @property
+    def registry(self):
+        """Return the registry of shared chords."""
+        return self._registry
+
+    @property
+    def compact(self):
+        """Return true if compact chords are generated."""
+        return self._compact
+
+    @property
+    def workers(self):
+        """Return the number of shards generated in parallel."""
+        return self._workers
+
+    @property
+    def executor(self):
+        """Return the executor used to generate shards."""
+        return self._executor
+
+    @property
+    def memory_budget(self):
+        """Return the maximum number of bytes used to veto chords."""
+        return self._memory_budget
+
+    @property
+    def batch_select(self):
+        """Return function to select batches of chords."""
+        return self._batch_select
+
+    @property
+    def batch_size(self):
+        """Return the number of chords in each batch."""
+        return self._batch_size
+
+    @property
+    def cache(self):
+        """Return the directory where to cache the generated chords."""
+        return self._cache
+
     @staticmethod
     def _copy_fix_octaves(pitches):
         """Make chord octive consistent with their
@@ -144,6 +470,516 @@ class Generator:
                 curr.octave += 1
         return pitches
 
+    def _values(self) -> tuple:
+        """Return lists with the pitch class, octave and
+        pitch space step of each pitch."""
+        return (
+            [pitch.pitchClass for pitch in self._pitches],
+            [pitch.octave for pitch in self._pitches],
+            [pitch.ps for pitch in self._pitches]
+        )
+
+    @staticmethod
+    def _fix_octaves(indexes, steps, octaves, divisions=12):
+        """Compute chord octaves consistent with their
+        location within the chord using pitch steps."""
+        octave = octaves[indexes[0]]
+        offset = divisions*octave
+        new_octaves = []
+        previous = None
+        for index in indexes:
+            step = steps[index] - offset
+            new_octave = octaves[index] - octave
+            if previous is not None and previous > step:
+                shift = -((step - previous)//divisions)
+                step += divisions*shift
+                new_octave += shift
+            new_octaves.append(new_octave)
+            previous = step
+        return tuple(new_octaves)
+
+    def _ntuples(self) -> Iterator[tuple]:
+        """Return an iterator to the tuples to be made chords.
+
+        In compact mode the tuples are pitch indexes,
+        otherwise they are tuples of pitches.
+        """
+        pitches = self._pitches
+        if self._canonical:
+            ntuples = canonicalOrbits(
+                pitches, self._dimension,
+                self._combinator, self._identify
+            )
+        elif self._compact:
+            ntuples = self._combinator(
+                range(len(pitches)), self._dimension
+            )
+        else:
+            return self._combinator(pitches, self._dimension)
+        if self._compact:
+            return ntuples
+        return map(self._ntuple, ntuples)
+
+    def _ntuple(self, indexes: tuple) -> tuple:
+        """Return the tuple to be made chord from pitch indexes."""
+        if self._compact:
+            return indexes
+        return tuple(self._pitches[index] for index in indexes)
+
+    def _chord(self, ntuple: tuple) -> Chord:
+        """Create a chord from a tuple."""
+        if not self._compact:
+            return IdentifiedChord(
+                identify = self._identify,
+                notes = self._copy_fix_octaves(ntuple)
+            )
+        pitches = self._pitches
+        pitch_classes, octaves, steps = self._pitch_values
+        return CompactChord(
+            pitches = tuple(pitches[index] for index in ntuple),
+            octaves = self._fix_octaves(
+                ntuple, steps, octaves, self.divisions
+            ),
+            identify = self._identify,
+            pitchClasses = tuple(
+                pitch_classes[index] for index in ntuple
+            ),
+            divisions = self.divisions
+        )
+
+    def _unique(self,
+        pairs: Iterator[tuple],
+        store: tuple = None
+    ) -> Iterator[tuple]:
+        """Veto identical chords from pairs of key and chord.
+
+        The store is a tuple with the function that maps chords to keys and
+        the store of vetoed identities, by default a new store is created.
+        """
+        # There is no need to veto chords if orbits are canonical
+        if self._canonical:
+            yield from pairs
+            return
+        # Store of identities of vetoed chords
+        if store is None:
+            store = identityStore(
+                self._identify, self._dimension,
+                self._memory_budget, divisions = self.divisions
+            )
+        identity, vetoed_identities = store
+        for key, chord in pairs:
+            if not vetoed_identities.add(identity(chord)):
+                continue
+            yield key, chord
+
+    def _selected(self, pairs: Iterator[tuple]) -> Iterator[tuple]:
+        """Select chords from pairs of key and chord.
+
+        Yields
+        ------
+            tuple
+                Key, chord and a boolean that is true if chord is selected.
+        """
+        select = self._select
+        batch_select = self._batch_select
+        if batch_select is None:
+            for key, chord in pairs:
+                yield key, chord, not select or bool(select(chord))
+            return
+        while True:
+            batch = list(islice(pairs, self._batch_size))
+            if not batch:
+                return
+            mask = batch_select(numpy.array(
+                [chord.pitchClasses for _, chord in batch],
+                dtype=numpy.int64
+            ))
+            for (key, chord), selected in zip(batch, mask):
+                if selected and select:
+                    selected = select(chord)
+                yield key, chord, bool(selected)
+
+    def _shard_chords(self,
+        shard_index: int,
+        shard_count: int
+    ) -> Iterator[tuple]:
+        """Identify and select the chords of a shard.
+
+        The shard is made of every tuple which position modulo the number
+        of shards is the shard index.
+
+        Parameters
+        ----------
+            shard_index : int
+                Index of the shard.
+            shard_count : int
+                Number of shards.
+
+        Yields
+        ------
+            tuple
+                Tuple position, chord and a boolean that is true if the
+                chord is selected, for the first occurence of each identity
+                within the shard.
+        """
+        ntuples = islice(self._ntuples(), shard_index, None, shard_count)
+        pairs = (
+            (position, self._chord(ntuple)) for position, ntuple in zip(
+                count(shard_index, shard_count), ntuples
+            )
+        )
+        return self._selected(self._unique(pairs))
+
+    def _run_shard(self, shard_index: int, shard_count: int) -> list:
+        """Identify and select the chords of a shard.
+
+        Return
+        ------
+            list
+                List of tuple position, chord identity key and a boolean
+                that is true if the chord is selected (see _shard_chords).
+        """
+        identity, _ = identityStore(
+            self._identify, self._dimension, divisions = self.divisions
+        )
+        return [
+            (position, identity(chord), selected)
+            for position, chord, selected in
+            self._shard_chords(shard_index, shard_count)
+        ]
+
+    def _run_sharded(self) -> Iterator[Chord]:
+        """Generate a sequence of chords using an executor."""
+        executor = self._executor
+        if executor is None:
+            executor = ProcessPoolExecutor(max_workers=self._workers)
+        shard_count = self._workers or os.cpu_count() or 1
+        try:
+            futures = [
+                executor.submit(_run_shard, self, shard_index, shard_count)
+                for shard_index in range(shard_count)
+            ]
+            # Keep the first occurence of each identity
+            first_positions = {}
+            for future in futures:
+                for position, identity, selected in future.result():
+                    if identity in first_positions and \
+                        first_positions[identity][0] < position:
+                        continue
+                    first_positions[identity] = (position, selected)
+        finally:
+            if self._executor is None:
+                executor.shutdown()
+        positions = sorted(
+            position for position, selected in first_positions.values()
+            if selected
+        )
+        # Recreate the selected chords
+        ntuples = self._ntuples()
+        previous = -1
+        for position in positions:
+            ntuple = next(islice(ntuples, position - previous - 1, None))
+            previous = position
+            yield self._chord(ntuple)
+
+    def count(self) -> int:
+        """Count the chords in the space before selection.
+
+        The count is computed in closed form without generating chords.
+
+        Return
+        ------
+            int
+                Number of chords in the space.
+
+        Raises
+        ------
+            ValueError
+                if there is no canonical enumeration for the generator.
+        """
+        orbits = orbitEnumeration(
+            self._pitches, self._combinator, self._identify
+        )
+        return ORBIT_COUNTS[orbits](len(self._pitches), self._dimension)
+
+    def estimate(self,
+        samples: int = 1000,
+        seed: int = None,
+        confidence: float = 0.95
+    ) -> Estimate:
+        """Estimate the number of chords generated.
+
+        If there are no select functions, the number of chords is exact.
+        Otherwise, the fraction of selected chords is estimated from
+        random chords drawn uniformly, and the interval is computed
+        using the Wilson score interval.
+
+        Parameters
+        ----------
+            samples : int, optional
+                Number of random chords.
+            seed : int, optional
+                Seed of the random number generator.
+            confidence : float, optional
+                Confidence level of the interval.
+
+        Return
+        ------
+            Estimate
+                Named tuple with the estimated value, lower and upper
+                bounds of the interval and number of samples.
+
+        Raises
+        ------
+            ValueError
+                if there is no canonical enumeration for the generator.
+        """
+        orbits = orbitEnumeration(
+            self._pitches, self._combinator, self._identify
+        )
+        size = ORBIT_COUNTS[orbits](len(self._pitches), self._dimension)
+        if not self._select and not self._batch_select:
+            return Estimate(size, size, size, 0)
+        random = Random(seed)
+        pairs = (
+            (None, self._chord(self._ntuple(
+                RANDOM_ORBITS[orbits](
+                    len(self._pitches), self._dimension, random
+                )
+            ))) for _ in range(samples)
+        )
+        selected = sum(
+            selected for _, _, selected in self._selected(pairs)
+        )
+        # Wilson score interval
+        z = NormalDist().inv_cdf(0.5 + confidence/2)
+        fraction = selected/samples
+        center = (fraction + z*z/(2*samples))/(1 + z*z/samples)
+        width = z*math.sqrt(
+            fraction*(1 - fraction)/samples + z*z/(4*samples*samples)
+        )/(1 + z*z/samples)
+        return Estimate(
+            size*fraction,
+            size*max(center - width, 0),
+            size*min(center + width, 1),
+            samples
+        )
+
+    def sample(self,
+        k: int,
+        seed: int = None,
+        weighted: bool = False,
+        max_draws: int = None,
+        report: Callable[[SampleReport], None] = None
+    ) -> Iterator[Chord]:
+        """Sample random chords from the space.
+
+        Chords are drawn independently and uniformly from the orbits, or
+        weighted by the number of combinations in each orbit. Chords not
+        selected are rejected and drawn again, up to a maximum number of
+        draws, so fewer than k chords are yielded if most chords are
+        rejected. When selecting in batches, the draws of a whole batch are
+        consumed and reported even if the sampling stops before the end of
+        the batch.
+
+        Parameters
+        ----------
+            k : int
+                Number of chords.
+            seed : int, optional
+                Seed of the random number generator.
+            weighted : bool, optional
+                Weight orbits by their number of combinations.
+            max_draws : int, optional
+                Maximum number of chords drawn, by default
+                SAMPLE_MAX_DRAWS_PER_CHORD times k.
+            report : Callable[[SampleReport], None], optional
+                Function called with the sampling report when finished.
+
+        Yields
+        ------
+            Chord
+                Random chords from the space.
+
+        Raises
+        ------
+            ValueError
+                if there is no canonical enumeration for the generator.
+        """
+        orbits = orbitEnumeration(
+            self._pitches, self._combinator, self._identify
+        )
+        random_orbit = (WEIGHTED_RANDOM_ORBITS if weighted else \
+            RANDOM_ORBITS)[orbits]
+        random = Random(seed)
+        size = len(self._pitches)
+        if max_draws is None:
+            max_draws = SAMPLE_MAX_DRAWS_PER_CHORD*k
+        draws = [0]
+        selected = 0
+        start = time.perf_counter()
+
+        def pairs():
+            """Draw random chords counting the draws."""
+            while draws[0] < max_draws:
+                draws[0] += 1
+                yield None, self._chord(self._ntuple(
+                    random_orbit(size, self._dimension, random)
+                ))
+
+        try:
+            for _, chord, accepted in self._selected(pairs()):
+                if not accepted:
+                    continue
+                selected += 1
+                yield chord
+                if selected == k:
+                    break
+        finally:
+            if report:
+                seconds = time.perf_counter() - start
+                report(SampleReport(
+                    draws[0], selected, seconds,
+                    draws[0]/seconds if seconds > 0 else math.inf
+                ))
+
+    def run_checkpointed(self,
+        directory: str,
+        interval: int = 100000
+    ) -> Iterator[Chord]:
+        """Generate a sequence of chords that can be resumed.
+
+        The combinator tuples are processed in segments. After each
+        segment, the selected chords are written to a new chunk file and
+        a checkpoint with the position in the combinator and the store
+        of vetoed identities is saved. Chords are yielded only after
+        the checkpoint is saved. If a checkpoint exists in the directory,
+        the generation is resumed from it, and only chords not written
+        in previous chunks are yielded. Use orbichord.cache.readChunks
+        to read all the chords.
+
+        Parameters
+        ----------
+            directory : str
+                Directory for the checkpoint and chunk files.
+            interval : int, optional
+                Number of combinator tuples between checkpoints.
+
+        Yields
+        ------
+            Iterator[Chord]
+                An iterator to the chords not yet written to chunks.
+
+        Raises
+        ------
+            ValueError
+                if the generator has a shard, workers, executor, cache,
+                progress or registry, the combinator, identify or select
+                functions have no stable name (e.g. lambda functions), the
+                checkpoint does not belong to the generator, or if the
+                store of vetoed identities can not be saved.
+        """
+        if self._shard is not None:
+            raise ValueError('Shards can not be checkpointed.')
+        if self._workers or self._executor or self._cache is not None or \
+            self._progress is not None or self._registry is not None:
+            raise ValueError(
+                'Checkpoints cannot be combined with workers, executor, '
+                'cache, progress or registry.'
+            )
+        os.makedirs(directory, exist_ok=True)
+        signature = self._signature()
+        state = readCheckpoint(directory)
+        if state is None:
+            store = None
+            if not self._canonical:
+                store = identityStore(
+                    self._identify, self._dimension,
+                self._memory_budget, divisions = self.divisions
+                )
+                if isinstance(store[1], SpillStore):
+                    raise ValueError(
+                        'Vetoed identities spilled to disk can not be saved.'
+                    )
+            state = {
+                'signature': signature,
+                'position': 0,
+                'chunks': 0,
+                'store': store and store[1],
+                'done': False
+            }
+        elif state['signature'] != signature:
+            raise ValueError('The checkpoint belongs to another generator.')
+        store = None
+        if state['store'] is not None:
+            store = (
+                identityStore(
+                    self._identify, self._dimension,
+                    divisions = self.divisions
+                )[0],
+                state['store']
+            )
+        ntuples = islice(self._ntuples(), state['position'], None)
+        while not state['done']:
+            segment = list(islice(ntuples, interval))
+            pairs = ((None, self._chord(ntuple)) for ntuple in segment)
+            chunk = [
+                chord for _, chord, selected in
+                self._selected(self._unique(pairs, store))
+                if selected
+            ]
+            if chunk:
+                writeChunk(directory, state['chunks'], chunk)
+                state['chunks'] += 1
+            state['position'] += len(segment)
+            state['done'] = len(segment) < interval
+            writeCheckpoint(directory, state)
+            yield from chunk
+
+    def _signature(self) -> str:
+        """Return a signature of the generator for checkpoints."""
+        return fingerprint(
+            self._pitches, self._dimension, self._combinator,
+            self._identify, self._select, self._canonical,
+            self._batch_select
+        )
+
+    def write_shard(self, path: str):
+        """Write the chords of the generator shard to a file.
+
+        The file has the position of each chord in the generator, so the
+        files of all shards can be merged into the chords of the generator
+        without shards (see orbichord.cache.mergeShards). If orbits are not
+        canonical, the chords that are not selected are also written, as
+        they veto the same chords in other shards.
+
+        Parameters
+        ----------
+            path : str
+                Path of the shard file.
+
+        Raises
+        ------
+            ValueError
+                if the generator has no shard.
+        """
+        if self._shard is None:
+            raise ValueError('The generator has no shard.')
+        entries = self._shard_chords(*self._shard)
+        if self._canonical:
+            entries = (entry for entry in entries if entry[2])
+        writeShard(path, entries)
+
+    def _run_cached(self) -> Iterator[Chord]:
+        """Read chords from cache or generate and write them."""
+        path = os.path.join(
+            self._cache, '{}.chords.gz'.format(self._fingerprint)
+        )
+        if os.path.exists(path):
+            return readChords(path, self._identify, self._compact)
+        os.makedirs(self._cache, exist_ok=True)
+        return writeChords(path, self._generate())
+
     def run(self) -> Iterator[Chord]:
         """Generate a sequence of chords.
 
@@ -152,24 +988,362 @@ class Generator:
             Iterator[Chord]
                 An iterator to the chords in the space.
         """
-        # List of identified chords
-        vetoed_chords = set()
-
-        # Sample the chord space as combination with
-        # replacement of the scale pitches.
-        for ntuple in self._combinator(
-            self._pitches, self._dimension
-        ):
-            # Generate the chord
-            chord = IdentifiedChord(
-                identify = self._identify,
-                notes = self._copy_fix_octaves(ntuple)
+        if self._cache is not None:
+            chords = self._run_cached()
+        else:
+            chords = self._generate()
+        if self._registry is not None:
+            return self._interned(chords)
+        return chords
+
+    def _interned(self, chords: Iterator[Chord]) -> Iterator[Chord]:
+        """Intern chords in the registry."""
+        intern = self._registry.intern
+        try:
+            for chord in chords:
+                yield intern(chord)
+        finally:
+            chords.close()
+
+    def run_batches(self,
+        batch_size: int = 4096,
+        scale: ConcreteScale = None
+    ) -> Iterator[ChordBatch]:
+        """Generate a sequence of batches of chords.
+
+        Each batch contains arrays with one chord per row. Identities are
+        integer codes for built-in identities (see orbichord.identify),
+        otherwise they are the identity strings.
+
+        Parameters
+        ----------
+            batch_size : int, optional
+                Maximum number of chords per batch.
+            scale : ConcreteScale, optional
+                Scale to compute the chord scale points.
+
+        Yields
+        ------
+            ChordBatch
+                Named tuple with arrays of pitch classes, octaves,
+                identities and scale points (None if no scale).
+        """
+        code = BATCH_IDENTITY_CODES.get(self._identify)
+        chords = self.run()
+        while True:
+            batch = list(islice(chords, batch_size))
+            if not batch:
+                return
+            pcs = numpy.array(
+                [chord.pitchClasses for chord in batch], dtype=numpy.int64
             )
-            # Veto identical chords
-            if chord in vetoed_chords:
-                continue
-            vetoed_chords.add(chord)
-            # select the chord?
-            if self._select and not self._select(chord):
-                continue
-            yield chord
+            octaves = numpy.array([
+                chord.octaves if isinstance(chord, CompactChord) else
+                [pitch.octave for pitch in chord.pitches]
+                for chord in batch
+            ], dtype=numpy.int64)
+            if code is None:
+                identities = numpy.array(
+                    [chord.identity for chord in batch]
+                )
+            else:
+                identities = code(pcs, self.divisions)
+            yield ChordBatch(
+                pcs, octaves, identities,
+                scalePoints(pcs, scale) if scale else None
+            )
+
+    async def arun(self,
+        batch_size: int = 256,
+        executor: Executor = None,
+        arrays: bool = False,
+        scale: ConcreteScale = None
+    ) -> AsyncIterator[list]:
+        """Generate asynchronously a sequence of batches of chords.
+
+        Each batch is generated in an executor, so the event loop is not
+        blocked. A new batch is only generated when the previous one is
+        consumed, and no more batches are generated after cancellation.
+
+        Parameters
+        ----------
+            batch_size : int, optional
+                Maximum number of chords per batch.
+            executor : Executor, optional
+                Thread executor, by default the event loop executor.
+            arrays : bool, optional
+                Yield batches of arrays (see Generator.run_batches).
+            scale : ConcreteScale, optional
+                Scale to compute the chord scale points of arrays.
+
+        Yields
+        ------
+            list
+                List of chords or ChordBatch if arrays are requested.
+        """
+        loop = asyncio.get_running_loop()
+        if arrays:
+            source = self.run_batches(batch_size, scale)
+            batches = source
+        else:
+            source = self.run()
+            batches = iter(lambda: list(islice(source, batch_size)), [])
+        # Lock to avoid closing the source while generating a batch
+        lock = threading.Lock()
+
+        def produce():
+            with lock:
+                return next(batches, None)
+
+        def close():
+            with lock:
+                source.close()
+
+        try:
+            while True:
+                batch = await loop.run_in_executor(executor, produce)
+                if batch is None:
+                    return
+                yield batch
+        finally:
+            if lock.acquire(blocking=False):
+                source.close()
+                lock.release()
+            else:
+                loop.run_in_executor(executor, close)
+
+    def _tuple_count(self) -> int:
+        """Return the number of tuples to examine or None if unknown."""
+        size = len(self._pitches)
+        if self._canonical:
+            total = self.count()
+        elif self._combinator is combinations_with_replacement:
+            total = multisetOrbitCount(size, self._dimension)
+        elif self._combinator is product:
+            total = permutationOrbitCount(size, self._dimension)
+        else:
+            return None
+        if self._shard is not None:
+            shard_index, shard_count = self._shard
+            total = len(range(shard_index, total, shard_count))
+        return total
+
+    def _run_instrumented(self) -> Iterator[Chord]:
+        """Generate a sequence of chords reporting progress."""
+        clock = time.perf_counter
+        counters = dict.fromkeys([
+            'examined', 'vetoed', 'rejected', 'selected',
+            'combine', 'identify', 'busy'
+        ], 0)
+        total = self._tuple_count()
+
+        def report(done):
+            busy = counters['busy']
+            self._progress(GenerationReport(
+                counters['examined'], counters['vetoed'],
+                counters['rejected'], counters['selected'], total,
+                counters['combine'], counters['identify'],
+                busy - counters['combine'] - counters['identify'],
+                busy, counters['examined']/busy if busy > 0 else math.inf,
+                done
+            ))
+
+        def combined():
+            ntuples = self._ntuples()
+            if self._shard is not None:
+                shard_index, shard_count = self._shard
+                ntuples = islice(ntuples, shard_index, None, shard_count)
+            ntuples = iter(ntuples)
+            while True:
+                start = clock()
+                ntuple = next(ntuples, None)
+                if ntuple is None:
+                    counters['combine'] += clock() - start
+                    return
+                chord = self._chord(ntuple)
+                counters['combine'] += clock() - start
+                counters['examined'] += 1
+                yield None, chord
+
+        def unique(pairs):
+            if self._canonical:
+                yield from pairs
+                return
+            identity, vetoed_identities = identityStore(
+                self._identify, self._dimension,
+                self._memory_budget, divisions = self.divisions
+            )
+            for pair in pairs:
+                start = clock()
+                added = vetoed_identities.add(identity(pair[1]))
+                counters['identify'] += clock() - start
+                if added:
+                    yield pair
+                else:
+                    counters['vetoed'] += 1
+
+        done = False
+        last = start = clock()
+        try:
+            for _, chord, selected in self._selected(unique(combined())):
+                counters['selected' if selected else 'rejected'] += 1
+                now = clock()
+                counters['busy'] += now - start
+                if now - last >= self._progress_interval:
+                    report(False)
+                    last = now
+                if selected:
+                    yield chord
+                start = clock()
+            counters['busy'] += clock() - start
+            done = True
+        finally:
+            report(done)
+
+    def _generate(self) -> Iterator[Chord]:
+        """Generate a sequence of chords without cache."""
+        # Generate reporting progress
+        if self._progress is not None:
+            yield from self._run_instrumented()
+            return
+
+        # Generate only the chords of the shard
+        if self._shard is not None:
+            for _, chord, selected in self._shard_chords(*self._shard):
+                if selected:
+                    yield chord
+            return
+
+        # Split the work in shards
+        if self._workers or self._executor:
+            yield from self._run_sharded()
+            return
+
+        # Sample the chord space using the combinator
+        pairs = ((None, self._chord(ntuple)) for ntuple in self._ntuples())
+        for _, chord, selected in self._selected(self._unique(pairs)):
+            if selected:
+                yield chord
+
+
+def _run_shard(
+    generator: Generator,
+    shard_index: int,
+    shard_count: int
+) -> list:
+    """Run a generator shard in a worker."""
+    return generator._run_shard(shard_index, shard_count)
+
+
+class EqualDivisionGenerator(Generator):
+    """Generate the space of n-pitches chords of equal divisions of the octave.
+
+    The generator works with integer pitch steps of any equal division of
+    the octave and always generates compact chords (see Generator). By
+    default, chords are identified by the integer mask of their pitch class
+    set and all chords are selected. Chords can not be cached on disk,
+    checkpointed or written to shard files, as these store music21 pitch
+    names.
+
+    Parameters
+    ----------
+        divisions : int, optional
+            Number of divisions of the octave.
+        steps : list, optional
+            List of pitch steps, by default one octave of steps.
+        dimension : int, optional
+            Dimension of the space.
+        combinator : Callable[[Iterable, int], Iterator], optional
+            Iterator function to generate all chord combinations.
+        identify : Callable[Chord, str], optional
+            Funtion to indentify chords.
+        select : Callable[Chord, str], optional
+            Function to select chords.
+        keywords :
+            Other arguments pass to Generator constructor.
+
+    Raises
+    ------
+        ValueError
+            if divisions are not positive, cache is requested, the string
+            identities are only unique for twelve divisions (see
+            orbichord.identify.TWELVE_DIVISION_IDENTITIES), or any of the
+            reason of Generator constructor.
+
+    Examples
+    --------
+    >>> from orbichord.generator import EqualDivisionGenerator
+    >>> generator = EqualDivisionGenerator(divisions = 19, dimension = 3)
+    >>> generator.count()
+    1159
+    >>> chord = next(generator.run())
+    >>> chord.pitchClasses, chord.octaves
+    ((0, 0, 0), (0, 0, 0))
+    """
+
+    def __init__(self,
+        divisions: int = 12,
+        steps: list = None,
+        dimension: int = 3,
+        combinator: Callable[[Iterable, int], Iterator] =\
+            combinations_with_replacement,
+        identify: Callable[[Chord], str] = chordPitchClassSetCode,
+        select: Callable[[Chord], bool] = None,
+        **keywords
+    ):
+        """Constructor."""
+        if divisions <= 0:
+            raise ValueError('The divisions has to be larger than zero.')
+        if keywords.get('cache') is not None:
+            raise ValueError('Cache is not supported for equal divisions.')
+        if divisions != 12 and identify in TWELVE_DIVISION_IDENTITIES:
+            raise ValueError(
+                'Identify function {} is only unique for twelve '
+                'divisions.'.format(getattr(identify, '__name__', identify))
+            )
+        if steps is None:
+            steps = range(divisions)
+        self._divisions = divisions
+        keywords['compact'] = True
+        super().__init__(
+            pitches = [EqualDivisionPitch(step, divisions) for step in steps],
+            dimension = dimension,
+            combinator = combinator,
+            identify = identify,
+            select = select,
+            **keywords
+        )
+
+    @property
+    def divisions(self):
+        """Return the number of divisions of the octave."""
+        return self._divisions
+
+    def write_shard(self, path: str):
+        """Shard files are not supported for equal divisions.
+
+        Raises
+        ------
+            ValueError
+                always, as shard files store music21 pitch names.
+        """
+        raise ValueError('Shard files are not supported for equal divisions.')
+
+    def run_checkpointed(self, directory: str, interval: int = 100000):
+        """Checkpoints are not supported for equal divisions.
+
+        Raises
+        ------
+            ValueError
+                always, as chunk files store music21 pitch names.
+        """
+        raise ValueError('Checkpoints are not supported for equal divisions.')
+
+    def _values(self) -> tuple:
+        """Return lists with the pitch class, octave
+        and step of each pitch."""
+        return (
+            [pitch.pitchClass for pitch in self._pitches],
+            [pitch.octave for pitch in self._pitches],
+            [pitch.step for pitch in self._pitches]
+        )
@@ -1,8 +1,13 @@
 """Define a set of common chord identyfier."""
 
+from abc import ABCMeta, abstractmethod
 from copy import deepcopy
+from functools import lru_cache, partial
+import hashlib
 from music21.chord import Chord
-from typing import Callable
+from music21.pitch import Pitch
+import numpy
+from typing import Callable, Iterable
 
 
 def base10toN(num: int, base: int=12):
@@ -37,6 +42,53 @@ def base10toN(num: int, base: int=12):
     return converted_string
 
 
+def pitchClassesString(pcs: Iterable[int], divisions: int = 12) -> str:
+    """Return the string of a sequence of pitch classes.
+
+    Each pitch class is written as a digit in base N (at least base 12).
+    Above 36 divisions the pitch classes are written in decimal and
+    separated by dots.
+
+    Parameters
+    ----------
+        pcs : Iterable[int]
+            Pitch classes.
+        divisions : int, optional
+            Number of divisions of the octave.
+
+    Return
+    ------
+        str
+            A string with the pitch classes.
+
+    Examples
+    --------
+    >>> from orbichord.identify import pitchClassesString
+    >>> pitchClassesString([0, 4, 11]), pitchClassesString([0, 40, 11], 53)
+    ('<04B>', '<0.40.11>')
+    """
+    if divisions > 36:
+        return '<' + '.'.join(map(str, pcs)) + '>'
+    base = max(divisions, 12)
+    return '<' + ''.join(base10toN(pc, base) for pc in pcs) + '>'
+
+
+def chordOrderedPitchClasses(chord : Chord) -> str:
+    """Identify chords based on its ordered set of pitch classes.
+
+    Parameters
+    ----------
+        chord : Chord
+            Chord to be identified.
+
+    Return
+    ------
+        str
+            A string with the sorted and unique pitch classes.
+    """
+    return chord.orderedPitchClassesString
+
+
 def chordPitchClasses(chord : Chord) -> str:
     """Identify chords based on its pitch classes.
 
@@ -67,11 +119,7 @@ def chordPitchNames(chord : Chord) -> str:
         str
             A string with the pitch names.
     """
-    names = map(
-        lambda pitch: pitch.name,
-        chord.pitches
-    )
-    return ''.join(names)
+    return ''.join(chord.pitchNames)
 
 
 def chordSymbolIndex(chord : Chord) -> str:
@@ -102,3 +150,1320 @@ def chordSymbolIndex(chord : Chord) -> str:
     # independent of the permutations.
     pcs = [pcs[0]] + sorted(pcs[1:])
     return '<' + ''.join(map(base10toN, pcs)) + '>'
+
+
+def identityDigest(identity) -> int:
+    """Compute a deterministic digest of a chord identity.
+
+    Unlike the hash of strings, the digest is the same across processes
+    and runs, so it can be used as key of shared or on-disk caches.
+    Identity codes have the same digest as their identity strings.
+
+    Parameters
+    ----------
+        identity :
+            Chord identity (e.g. a string or an IdentityCode).
+
+    Return
+    ------
+        int
+            Unsigned 64 bits digest.
+
+    Examples
+    --------
+    >>> from orbichord.identify import identityDigest
+    >>> identityDigest('<047>')
+    15497481869082886955
+    """
+    return int.from_bytes(hashlib.blake2b(
+        str(identity).encode('utf-8'), digest_size = 8
+    ).digest(), 'little')
+
+
+class IdentityCode(int, metaclass=ABCMeta):
+    """Integer chord identity.
+
+    Identity codes are integers, so they are hashed in constant time, and
+    they are converted to the string of their identity with str. Codes of
+    different kinds of identities or numbers of divisions of the octave
+    are never equal. The codes of other equal divisions of the octave are
+    created with identityCode.
+    """
+
+    __slots__ = ()
+    # Number of divisions of the octave
+    divisions = 12
+
+    def __repr__(self):
+        """Return the class name and integer code."""
+        return '{}({})'.format(self.__class__.__name__, int(self))
+
+    def __str__(self):
+        """Return the identity string."""
+        return pitchClassesString(self.pitchClasses(), self.divisions)
+
+    def __eq__(self, other):
+        """Compare the codes if both are the same kind of identity."""
+        if isinstance(other, IdentityCode) and type(self) is not type(other):
+            return False
+        return int.__eq__(self, other)
+
+    def __ne__(self, other):
+        """Return true if the identities are not equal."""
+        equal = self.__eq__(other)
+        return equal if equal is NotImplemented else not equal
+
+    __hash__ = int.__hash__
+
+    def __reduce__(self):
+        """Return the arguments to pickle the identity."""
+        kind = self.__class__.__dict__.get('_kind', self.__class__)
+        return identityCode, (
+            kind, int(self), self.divisions, getattr(self, 'symmetries', None)
+        )
+
+    @abstractmethod
+    def pitchClasses(self) -> list:
+        """Return the pitch classes of the identity."""
+
+
+class PitchClassSetIdentity(IdentityCode):
+    """Identity of the set of pitch classes as a bit mask.
+
+    Examples
+    --------
+    >>> from orbichord.identify import PitchClassSetIdentity
+    >>> identity = PitchClassSetIdentity(145)
+    >>> print(identity)
+    <047>
+    >>> identity.pitchClasses(), identity == 145
+    ([0, 4, 7], True)
+    """
+
+    __slots__ = ()
+
+    def pitchClasses(self) -> list:
+        """Return the sorted pitch classes."""
+        return [pc for pc in range(self.bit_length()) if self >> pc & 1]
+
+
+class PitchClassesIdentity(IdentityCode):
+    """Identity of the sequence of pitch classes as a base-N number.
+
+    Examples
+    --------
+    >>> from orbichord.identify import PitchClassesIdentity
+    >>> print(PitchClassesIdentity(int('1470', 12)))
+    <470>
+    """
+
+    __slots__ = ()
+
+    def pitchClasses(self) -> list:
+        """Return the pitch classes in order."""
+        pcs = []
+        code = int(self)
+        while code > 1:
+            code, pc = divmod(code, self.divisions)
+            pcs.append(pc)
+        return pcs[::-1]
+
+
+class SymbolIndexIdentity(IdentityCode):
+    """Identity of the bass and the set of remaining pitch classes.
+
+    Examples
+    --------
+    >>> from orbichord.identify import SymbolIndexIdentity
+    >>> print(SymbolIndexIdentity(4*4096 + 129))
+    <407>
+    """
+
+    __slots__ = ()
+
+    def pitchClasses(self) -> list:
+        """Return the bass followed by the remaining sorted pitch classes."""
+        bass = self >> self.divisions
+        mask = self & ((1 << self.divisions) - 1)
+        return [bass] + [
+            pc for pc in range(self.divisions) if mask >> pc & 1
+        ]
+
+
+class TClassIdentity(PitchClassSetIdentity):
+    """Identity of the T-class of a pitch class set as the mask of its prime."""
+
+    __slots__ = ()
+
+
+class TIClassIdentity(PitchClassSetIdentity):
+    """Identity of the TI-class of a pitch class set as the mask of its
+    prime."""
+
+    __slots__ = ()
+
+
+class OrbitIdentity(PitchClassesIdentity):
+    """Identity of the orbit of a chord under some symmetries as its smallest
+    sequence of pitch classes (see orbitLabels)."""
+
+    __slots__ = ()
+    # Letters of the symmetries
+    symmetries = None
+
+
+@lru_cache(maxsize=None)
+def _identityType(kind: type, divisions: int, symmetries: str) -> type:
+    """Return the identity code class for a number of divisions."""
+    if divisions == 12 and symmetries is None:
+        return kind
+    return type(kind)(kind.__name__, (kind,), {
+        '__slots__': (), '_kind': kind, 'divisions': divisions,
+        'symmetries': symmetries
+    })
+
+
+def identityCode(
+    kind: type,
+    code: int,
+    divisions: int = 12,
+    symmetries: str = None
+) -> IdentityCode:
+    """Create an identity code.
+
+    Parameters
+    ----------
+        kind : type
+            Identity code class (e.g. PitchClassSetIdentity).
+        code : int
+            Integer code.
+        divisions : int, optional
+            Number of divisions of the octave.
+        symmetries : str, optional
+            Letters of the symmetries of orbit identities.
+
+    Return
+    ------
+        IdentityCode
+            The identity code.
+
+    Examples
+    --------
+    >>> from orbichord.identify import identityCode, PitchClassesIdentity
+    >>> print(identityCode(PitchClassesIdentity, 24*24 + 13, 24))
+    <0D>
+    """
+    return _identityType(kind, divisions, symmetries)(code)
+
+
+def pitchClassSetCode(pcs: list) -> int:
+    """Pack the set of pitch classes as a bit mask.
+
+    Integer code of chordOrderedPitchClasses identity.
+
+    Parameters
+    ----------
+        pcs : list
+            List of pitch classes.
+
+    Return
+    ------
+        int
+            Mask with one bit set per pitch class.
+
+    Examples
+    --------
+    >>> from orbichord.identify import pitchClassSetCode
+    >>> pitchClassSetCode([7, 0, 4, 0])
+    145
+    """
+    code = 0
+    for pc in pcs:
+        code |= 1 << pc
+    return code
+
+
+def pitchClassesCode(pcs: list, base: int = 12) -> int:
+    """Pack the sequence of pitch classes as a base-N number.
+
+    Integer code of chordPitchClasses identity. The code starts with
+    a leading one digit so sequences of different length are different.
+
+    Parameters
+    ----------
+        pcs : list
+            List of pitch classes.
+        base : int, optional
+            Number of pitch classes.
+
+    Return
+    ------
+        int
+            Base-N number with one digit per pitch class.
+
+    Examples
+    --------
+    >>> from orbichord.identify import pitchClassesCode
+    >>> pitchClassesCode([0, 4, 7]) == int('1047', 12)
+    True
+    """
+    code = 1
+    for pc in pcs:
+        code = code*base + pc
+    return code
+
+
+def symbolIndexCode(pcs: list, base: int = 12) -> int:
+    """Pack the bass and the set of remaining pitch classes.
+
+    Integer code of chordSymbolIndex identity.
+
+    Parameters
+    ----------
+        pcs : list
+            List of pitch classes.
+        base : int, optional
+            Number of pitch classes.
+
+    Return
+    ------
+        int
+            Bass pitch class times 2^N plus the mask of remaining pitch classes.
+
+    Examples
+    --------
+    >>> from orbichord.identify import symbolIndexCode
+    >>> symbolIndexCode([4, 0, 7, 4]) == 4*4096 + 129
+    True
+    """
+    bass = pcs[0]
+    return (bass << base) | (pitchClassSetCode(pcs) & ~(1 << bass))
+
+
+def chordPitchClassSetCode(chord : Chord) -> int:
+    """Identify chords based on the mask of its set of pitch classes.
+
+    Integer version of chordOrderedPitchClasses for any number of divisions
+    of the octave (see orbichord.chord.CompactChord).
+
+    Parameters
+    ----------
+        chord : Chord
+            Chord to be identified.
+
+    Return
+    ------
+        PitchClassSetIdentity
+            Mask with one bit set per pitch class.
+    """
+    divisions = getattr(chord, 'divisions', 12)
+    return identityCode(
+        PitchClassSetIdentity, pitchClassSetCode(chord.pitchClasses),
+        divisions
+    )
+
+
+def chordPitchClassesCode(chord : Chord) -> int:
+    """Identify chords based on its packed pitch classes.
+
+    Integer version of chordPitchClasses for any number of divisions
+    of the octave (see orbichord.chord.CompactChord).
+
+    Parameters
+    ----------
+        chord : Chord
+            Chord to be identified.
+
+    Return
+    ------
+        PitchClassesIdentity
+            Base-N number with one digit per pitch class.
+    """
+    divisions = getattr(chord, 'divisions', 12)
+    return identityCode(
+        PitchClassesIdentity, pitchClassesCode(chord.pitchClasses, divisions),
+        divisions
+    )
+
+
+def chordSymbolIndexCode(chord : Chord) -> int:
+    """Identify chords based on its packed chord symbol index.
+
+    Integer version of chordSymbolIndex for any number of divisions
+    of the octave (see orbichord.chord.CompactChord).
+
+    Parameters
+    ----------
+        chord : Chord
+            Chord to be identified.
+
+    Return
+    ------
+        SymbolIndexIdentity
+            Bass pitch class times 2^N plus the mask of remaining pitch classes.
+    """
+    divisions = getattr(chord, 'divisions', 12)
+    return identityCode(
+        SymbolIndexIdentity, symbolIndexCode(chord.pitchClasses, divisions),
+        divisions
+    )
+
+
+# Maximum number of pitch class set masks of the set class tables
+SET_CLASS_TABLE_MAX_SIZE = 1 << 20
+
+
+def _tableMasks(divisions: int) -> numpy.ndarray:
+    """Return all the pitch class set masks of the set class tables."""
+    size = 1 << divisions
+    if size > SET_CLASS_TABLE_MAX_SIZE:
+        raise ValueError(
+            'Too many pitch class sets ({}) for the set class tables.'.format(
+            size
+        ))
+    return numpy.arange(size, dtype=numpy.int64)
+
+
+def _rotate(masks: numpy.ndarray, transposition: int, divisions: int):
+    """Return the masks transposed."""
+    return (
+        (masks << transposition) | (masks >> (divisions - transposition))
+    ) & ((1 << divisions) - 1)
+
+
+@lru_cache(maxsize=None)
+def _setClassTables(divisions: int = 12) -> tuple:
+    """Return the set class tables over all pitch class set masks.
+
+    The tables have one entry per mask: the mask of the T-class prime, the
+    mask of the TI-class prime and the first pitch class of the normal
+    order. Normal orders and primes follow the same convention as music21:
+    the ordering with the smallest span, and then the most packed to the
+    left, breaking ties by the lowest first pitch class.
+    """
+    masks = _tableMasks(divisions)
+    size = len(masks)
+    full = size - 1
+
+    def rotate(masks, transposition):
+        """Return the masks transposed."""
+        return _rotate(masks, transposition, divisions)
+
+    # Span and reversed bits of every mask
+    spans = numpy.zeros(size, dtype=numpy.int64)
+    reversed_masks = numpy.zeros(size, dtype=numpy.int64)
+    for pc in range(divisions):
+        bits = (masks >> pc) & 1
+        spans[bits == 1] = pc
+        reversed_masks |= bits << (divisions - 1 - pc)
+    # Order by span and then by the smallest pitch classes
+    orders = (spans << divisions) | (full - reversed_masks)
+
+    def primes(masks):
+        """Return the best transposition containing zero."""
+        prime = numpy.zeros(size, dtype=numpy.int64)
+        first = numpy.zeros(size, dtype=numpy.int64)
+        order = numpy.full(size, size << divisions, dtype=numpy.int64)
+        for pc in range(divisions):
+            rotation = rotate(masks, -pc % divisions)
+            better = (rotation & 1).astype(bool) & \
+                (orders[rotation] < order)
+            prime[better] = rotation[better]
+            first[better] = pc
+            order[better] = orders[rotation[better]]
+        return prime, first, order
+
+    t_primes, firsts, t_orders = primes(masks)
+    inversions = numpy.zeros(size, dtype=numpy.int64)
+    for pc in range(divisions):
+        inversions |= ((masks >> pc) & 1) << (-pc % divisions)
+    i_primes, _, i_orders = primes(inversions)
+    ti_primes = numpy.where(i_orders < t_orders, i_primes, t_primes)
+    return t_primes, ti_primes, firsts
+
+
+@lru_cache(maxsize=None)
+def _intervalVectorTable(divisions: int = 12) -> numpy.ndarray:
+    """Return the interval vector of every pitch class set mask."""
+    masks = _tableMasks(divisions)
+    interval_vectors = numpy.zeros(
+        (len(masks), divisions//2), dtype=numpy.int64
+    )
+    for interval in range(1, divisions//2 + 1):
+        common = masks & _rotate(masks, interval, divisions)
+        count = numpy.zeros(len(masks), dtype=numpy.int64)
+        for pc in range(divisions):
+            count += (common >> pc) & 1
+        if 2*interval == divisions:
+            count //= 2
+        interval_vectors[:, interval - 1] = count
+    return interval_vectors
+
+
+@lru_cache(maxsize=None)
+def _forteTable() -> dict:
+    """Return the Forte class of each TI-class prime mask."""
+    _, ti_primes, _ = _setClassTables(12)
+    return {
+        int(prime): Chord([pc for pc in range(12) if prime >> pc & 1])\
+            .forteClassTnI for prime in numpy.unique(ti_primes) if prime
+    }
+
+
+def tClassCode(pcs: list, divisions: int = 12) -> int:
+    """Return the mask of the T-class prime of the pitch classes.
+
+    Parameters
+    ----------
+        pcs : list
+            List of pitch classes.
+        divisions : int, optional
+            Number of divisions of the octave.
+
+    Return
+    ------
+        int
+            Mask of the transposition with the smallest span
+            most packed to the left.
+
+    Raises
+    ------
+        ValueError
+            if there are more than SET_CLASS_TABLE_MAX_SIZE pitch class sets.
+
+    Examples
+    --------
+    >>> from orbichord.identify import tClassCode
+    >>> tClassCode([7, 11, 2]) == pitchClassSetCode([0, 4, 7])
+    True
+    """
+    return int(_setClassTables(divisions)[0][pitchClassSetCode(pcs)])
+
+
+def tiClassCode(pcs: list, divisions: int = 12) -> int:
+    """Return the mask of the TI-class prime of the pitch classes.
+
+    Parameters
+    ----------
+        pcs : list
+            List of pitch classes.
+        divisions : int, optional
+            Number of divisions of the octave.
+
+    Return
+    ------
+        int
+            Mask of the transposition or inversion with the smallest
+            span most packed to the left.
+
+    Raises
+    ------
+        ValueError
+            if there are more than SET_CLASS_TABLE_MAX_SIZE pitch class sets.
+
+    Examples
+    --------
+    >>> from orbichord.identify import tiClassCode
+    >>> tiClassCode([7, 11, 2]) == pitchClassSetCode([0, 3, 7])
+    True
+    """
+    return int(_setClassTables(divisions)[1][pitchClassSetCode(pcs)])
+
+
+def _maskString(mask: int, divisions: int, first: int = 0) -> str:
+    """Return the string of the pitch classes of a mask from a first one."""
+    pcs = [pc for pc in range(divisions) if mask >> pc & 1]
+    return pitchClassesString(
+        [(pc + first) % divisions for pc in pcs], divisions
+    )
+
+
+def chordNormalForm(chord : Chord) -> str:
+    """Identify chords based on the normal order of its pitch classes.
+
+    Parameters
+    ----------
+        chord : Chord
+            Chord to be identified.
+
+    Return
+    ------
+        str
+            A string with the pitch classes in normal order.
+
+    Examples
+    --------
+    >>> from music21.chord import Chord
+    >>> from orbichord.identify import chordNormalForm
+    >>> chordNormalForm(Chord('G B D'))
+    '<7B2>'
+    >>> chordNormalForm(Chord('B D G'))
+    '<7B2>'
+    """
+    divisions = getattr(chord, 'divisions', 12)
+    t_primes, _, firsts = _setClassTables(divisions)
+    mask = pitchClassSetCode(chord.pitchClasses)
+    return _maskString(int(t_primes[mask]), divisions, int(firsts[mask]))
+
+
+def chordPrimeForm(chord : Chord) -> str:
+    """Identify chords based on the prime form of its pitch class set.
+
+    Parameters
+    ----------
+        chord : Chord
+            Chord to be identified.
+
+    Return
+    ------
+        str
+            A string with the pitch classes of the prime form.
+
+    Examples
+    --------
+    >>> from music21.chord import Chord
+    >>> from orbichord.identify import chordPrimeForm
+    >>> chordPrimeForm(Chord('G B D'))
+    '<037>'
+    """
+    divisions = getattr(chord, 'divisions', 12)
+    return _maskString(tiClassCode(chord.pitchClasses, divisions), divisions)
+
+
+def chordForteClass(chord : Chord) -> str:
+    """Identify chords based on the Forte class of its pitch class set.
+
+    Only defined for twelve pitch classes.
+
+    Parameters
+    ----------
+        chord : Chord
+            Chord to be identified.
+
+    Return
+    ------
+        str
+            A string with the Forte class name.
+
+    Raises
+    ------
+        ValueError
+            if the chord is not of twelve pitch classes.
+
+    Examples
+    --------
+    >>> from music21.chord import Chord
+    >>> from orbichord.identify import chordForteClass
+    >>> chordForteClass(Chord('G B D'))
+    '3-11'
+    """
+    if getattr(chord, 'divisions', 12) != 12:
+        raise ValueError('Forte classes are only defined for 12 divisions.')
+    return _forteTable().get(tiClassCode(chord.pitchClasses), '0-1')
+
+
+def chordIntervalVector(chord : Chord) -> str:
+    """Identify chords based on the interval vector of its pitch class set.
+
+    Parameters
+    ----------
+        chord : Chord
+            Chord to be identified.
+
+    Return
+    ------
+        str
+            A string with the count of each interval class.
+
+    Examples
+    --------
+    >>> from music21.chord import Chord
+    >>> from orbichord.identify import chordIntervalVector
+    >>> chordIntervalVector(Chord('G B D'))
+    '<001110>'
+    """
+    divisions = getattr(chord, 'divisions', 12)
+    vector = _intervalVectorTable(divisions)[
+        pitchClassSetCode(chord.pitchClasses)
+    ]
+    return '<' + ''.join(base10toN(int(count), 36) for count in vector) + '>'
+
+
+def chordTClass(chord : Chord) -> int:
+    """Identify chords based on the T-class of its pitch class set.
+
+    Parameters
+    ----------
+        chord : Chord
+            Chord to be identified.
+
+    Return
+    ------
+        TClassIdentity
+            Mask of the T-class prime.
+    """
+    divisions = getattr(chord, 'divisions', 12)
+    return identityCode(
+        TClassIdentity, tClassCode(chord.pitchClasses, divisions),
+        divisions
+    )
+
+
+def chordTIClass(chord : Chord) -> int:
+    """Identify chords based on the TI-class of its pitch class set.
+
+    Parameters
+    ----------
+        chord : Chord
+            Chord to be identified.
+
+    Return
+    ------
+        TIClassIdentity
+            Mask of the TI-class prime.
+    """
+    divisions = getattr(chord, 'divisions', 12)
+    return identityCode(
+        TIClassIdentity, tiClassCode(chord.pitchClasses, divisions),
+        divisions
+    )
+
+
+# Maximum number of chords of the orbit tables
+ORBIT_TABLE_MAX_SIZE = 1 << 24
+
+
+def _unionFind(size: int, actions: list) -> numpy.ndarray:
+    """Join each element with its images by the actions using union-find.
+
+    The unions of all the elements are done in bulk by hooking the root of
+    each pair of elements to the smallest one and compressing the paths,
+    until all elements have the same root than their images.
+    """
+    parents = numpy.arange(size, dtype=numpy.int64)
+    while True:
+        for action in actions:
+            roots = parents.copy()
+            images = parents[action]
+            lows = numpy.minimum(roots, images)
+            numpy.minimum.at(parents, roots, lows)
+            numpy.minimum.at(parents, images, lows)
+            while True:
+                grandparents = parents[parents]
+                if (grandparents == parents).all():
+                    break
+                parents = grandparents
+        if all((parents[action] == parents).all() for action in actions):
+            return parents
+
+
+@lru_cache(maxsize=None)
+def _orbitLabels(divisions: int, dimension: int, symmetries: str):
+    """Compute the orbit labels of all sequences of pitch classes."""
+    size = divisions**dimension
+    if size > ORBIT_TABLE_MAX_SIZE:
+        raise ValueError(
+            'Too many chords ({}) for the orbit tables.'.format(size)
+        )
+    powers = divisions**numpy.arange(dimension - 1, -1, -1, dtype=numpy.int64)
+    pcs = numpy.arange(size, dtype=numpy.int64)[:, None] // powers % divisions
+    actions = []
+    if 'T' in symmetries:
+        actions.append((pcs + 1) % divisions)
+    if 'I' in symmetries:
+        actions.append(-pcs % divisions)
+    if 'P' in symmetries and dimension > 1:
+        # A swap and a cycle of the voices generate all the permutations
+        actions.append(pcs[:, [1, 0] + list(range(2, dimension))])
+        actions.append(numpy.roll(pcs, 1, axis=1))
+    if 'C' in symmetries and dimension > 1:
+        # Repeated pitch classes are replaced by the smallest one
+        pcs = numpy.sort(pcs, axis=1)
+        repeated = numpy.zeros(pcs.shape, dtype=bool)
+        repeated[:, 1:] = pcs[:, 1:] == pcs[:, :-1]
+        actions.append(numpy.where(repeated, pcs[:, :1], pcs))
+    labels = _unionFind(size, [action @ powers for action in actions])
+    labels.flags.writeable = False
+    return labels
+
+
+def orbitLabels(
+    divisions: int,
+    dimension: int,
+    symmetries: str = 'OPTIC'
+) -> numpy.ndarray:
+    """Label the orbits of all the chords with a given number of pitches.
+
+    Chords are encoded as integers by their sequence of pitch classes in
+    base N, and the orbits of the group generated by the symmetries are
+    found by union-find over the precomputed actions of the symmetries on
+    all the codes. Each chord is labelled with the smallest code of its
+    orbit, this is the lexicographically smallest sequence of pitch classes
+    of the orbit. The labels are computed once per number of divisions,
+    dimension and symmetries.
+
+    Symmetries are given by letters:
+        * O: octave (always, as chords are sequences of pitch classes),
+        * T: transposition,
+        * I: inversion,
+        * P: permutation of the pitches,
+        * C: cardinality (only with P), chords with the same set of pitch
+          classes are equivalent.
+
+    Parameters
+    ----------
+        divisions : int
+            Number of divisions of the octave.
+        dimension : int
+            Number of pitches in the chords.
+        symmetries : str, optional
+            Letters of the symmetries.
+
+    Return
+    ------
+        numpy.ndarray
+            Read-only array with the label of each chord code.
+
+    Raises
+    ------
+        ValueError
+            if the symmetries are unknown or C is given without P.
+
+    Examples
+    --------
+    >>> from orbichord.identify import orbitLabels
+    >>> labels = orbitLabels(12, 3, 'OPTIC')
+    >>> int(labels[int('047', 12)]) == int('037', 12)
+    True
+    >>> len(set(labels.tolist()))
+    19
+    """
+    symmetries = symmetries.upper()
+    if set(symmetries) - set('OTIPC'):
+        raise ValueError('Unknown symmetries {}.'.format(symmetries))
+    if 'C' in symmetries and 'P' not in symmetries:
+        raise ValueError('Cardinality symmetry requires permutations.')
+    return _orbitLabels(
+        divisions, dimension, ''.join(s for s in 'TIPC' if s in symmetries)
+    )
+
+
+def _orbitIdentity(chord : Chord, symmetries: str) -> int:
+    """Identify chords by their orbit under the symmetries."""
+    divisions = getattr(chord, 'divisions', 12)
+    pcs = chord.pitchClasses
+    base = divisions**len(pcs)
+    labels = orbitLabels(divisions, len(pcs), symmetries)
+    return identityCode(
+        OrbitIdentity,
+        base + int(labels[pitchClassesCode(pcs, divisions) - base]),
+        divisions,
+        ''.join(s for s in 'TIPC' if s in symmetries)
+    )
+
+
+def chordOT(chord : Chord) -> int:
+    """Identify ordered chords up to transposition (OT).
+
+    Parameters
+    ----------
+        chord : Chord
+            Chord to be identified.
+
+    Return
+    ------
+        OrbitIdentity
+            Smallest sequence of pitch classes of the orbit.
+    """
+    return _orbitIdentity(chord, 'OT')
+
+
+def chordOTI(chord : Chord) -> int:
+    """Identify ordered chords up to transposition and inversion (OTI).
+
+    Parameters
+    ----------
+        chord : Chord
+            Chord to be identified.
+
+    Return
+    ------
+        OrbitIdentity
+            Smallest sequence of pitch classes of the orbit.
+    """
+    return _orbitIdentity(chord, 'OTI')
+
+
+def chordOPT(chord : Chord) -> int:
+    """Identify chords up to permutation and transposition (OPT).
+
+    Parameters
+    ----------
+        chord : Chord
+            Chord to be identified.
+
+    Return
+    ------
+        OrbitIdentity
+            Smallest sequence of pitch classes of the orbit.
+    """
+    return _orbitIdentity(chord, 'OPT')
+
+
+def chordOPTI(chord : Chord) -> int:
+    """Identify chords up to permutation, transposition and inversion (OPTI).
+
+    Parameters
+    ----------
+        chord : Chord
+            Chord to be identified.
+
+    Return
+    ------
+        OrbitIdentity
+            Smallest sequence of pitch classes of the orbit.
+    """
+    return _orbitIdentity(chord, 'OPTI')
+
+
+def chordOPTC(chord : Chord) -> int:
+    """Identify chords up to permutation, transposition and cardinality (OPTC).
+
+    Parameters
+    ----------
+        chord : Chord
+            Chord to be identified.
+
+    Return
+    ------
+        OrbitIdentity
+            Smallest sequence of pitch classes of the orbit.
+
+    Examples
+    --------
+    >>> from music21.chord import Chord
+    >>> from orbichord.identify import chordOPTC
+    >>> print(chordOPTC(Chord('C E G')), chordOPTC(Chord('C E- G')))
+    <038> <037>
+    """
+    return _orbitIdentity(chord, 'OPTC')
+
+
+def chordOPTIC(chord : Chord) -> int:
+    """Identify chords up to permutation, transposition, inversion and
+    cardinality (OPTIC).
+
+    Parameters
+    ----------
+        chord : Chord
+            Chord to be identified.
+
+    Return
+    ------
+        OrbitIdentity
+            Smallest sequence of pitch classes of the orbit.
+
+    Examples
+    --------
+    >>> from music21.chord import Chord
+    >>> from orbichord.identify import chordOPTIC
+    >>> print(chordOPTIC(Chord('C E G')), chordOPTIC(Chord('C E- G')))
+    <037> <037>
+    """
+    return _orbitIdentity(chord, 'OPTIC')
+
+
+def identityCodeSize(
+    identify: Callable,
+    dimension: int,
+    divisions: int = 12
+) -> int:
+    """Return the number of possible integer codes of an identity.
+
+    Parameters
+    ----------
+        identify : Callable[[Chord], str]
+            Funtion to indentify chords.
+        dimension : int
+            Number of pitches in the chords.
+        divisions : int, optional
+            Number of divisions of the octave.
+
+    Return
+    ------
+        int
+            Upper bound of the identity integer codes, or None if
+            the identity has no integer code.
+    """
+    if identify in (chordOrderedPitchClasses, chordPitchClassSetCode,
+        chordNormalForm, chordPrimeForm, chordForteClass, chordTClass,
+        chordTIClass):
+        return 1 << divisions
+    if identify in (chordPitchClasses, chordPitchClassesCode, chordOT,
+        chordOTI, chordOPT, chordOPTI, chordOPTC, chordOPTIC):
+        return 2*divisions**dimension
+    if identify in (chordSymbolIndex, chordSymbolIndexCode):
+        return divisions << divisions
+    return None
+
+
+def identityStrings(
+    codes: numpy.ndarray,
+    kind: type,
+    divisions: int = 12
+) -> numpy.ndarray:
+    """Convert a batch of identity codes to identity strings.
+
+    Each distinct code is converted once.
+
+    Parameters
+    ----------
+        codes : numpy.ndarray
+            Array of integer codes.
+        kind : type
+            Identity code class (e.g. PitchClassSetIdentity).
+        divisions : int, optional
+            Number of divisions of the octave.
+
+    Return
+    ------
+        numpy.ndarray
+            Array with the identity string of each code.
+    """
+    uniques, inverse = numpy.unique(codes, return_inverse=True)
+    strings = numpy.array(
+        [str(identityCode(kind, int(code), divisions)) for code in uniques],
+        dtype=str
+    )
+    return strings[inverse.reshape(-1)]
+
+
+def pitchClassSetCodes(
+    pcs: numpy.ndarray,
+    divisions: int = 12,
+    strings: bool = False
+) -> numpy.ndarray:
+    """Identify a batch of chords by the mask of their pitch class set.
+
+    Batch version of chordPitchClassSetCode and chordOrderedPitchClasses.
+
+    Parameters
+    ----------
+        pcs : numpy.ndarray
+            Array of pitch classes with one chord per row.
+        divisions : int, optional
+            Number of divisions of the octave (up to 62).
+        strings : bool, optional
+            Return the identity strings instead of the codes.
+
+    Return
+    ------
+        numpy.ndarray
+            Array with the identity of each chord.
+
+    Examples
+    --------
+    >>> from orbichord.identify import pitchClassSetCodes
+    >>> pitchClassSetCodes([[0, 4, 7], [7, 0, 4]])
+    array([145, 145])
+    >>> pitchClassSetCodes([[0, 4, 7], [0, 4, 4]], strings = True)
+    array(['<047>', '<04>'], dtype='<U5')
+    """
+    pcs = numpy.asarray(pcs, dtype=numpy.int64)
+    codes = numpy.bitwise_or.reduce(
+        numpy.left_shift(1, pcs), axis=1
+    )
+    if strings:
+        return identityStrings(codes, PitchClassSetIdentity, divisions)
+    return codes
+
+
+def pitchClassesCodes(
+    pcs: numpy.ndarray,
+    divisions: int = 12,
+    strings: bool = False
+) -> numpy.ndarray:
+    """Identify a batch of chords by their packed pitch classes.
+
+    Batch version of chordPitchClassesCode and chordPitchClasses.
+
+    Parameters
+    ----------
+        pcs : numpy.ndarray
+            Array of pitch classes with one chord per row.
+        divisions : int, optional
+            Number of divisions of the octave.
+        strings : bool, optional
+            Return the identity strings instead of the codes.
+
+    Return
+    ------
+        numpy.ndarray
+            Array with the identity of each chord.
+
+    Raises
+    ------
+        ValueError
+            if the codes do not fit in 64 bits integers.
+
+    Examples
+    --------
+    >>> from orbichord.identify import pitchClassesCodes
+    >>> pitchClassesCodes([[4, 7, 0]], strings = True)
+    array(['<470>'], dtype='<U5')
+    """
+    pcs = numpy.asarray(pcs, dtype=numpy.int64)
+    dimension = pcs.shape[1]
+    if 2*divisions**dimension > numpy.iinfo(numpy.int64).max:
+        raise ValueError('Codes do not fit in 64 bits integers.')
+    powers = divisions**numpy.arange(dimension - 1, -1, -1, dtype=numpy.int64)
+    codes = divisions**dimension + pcs @ powers
+    if strings:
+        return identityStrings(codes, PitchClassesIdentity, divisions)
+    return codes
+
+
+def pitchNamesCodes(
+    pcs: numpy.ndarray,
+    divisions: int = 12,
+    strings: bool = False
+) -> numpy.ndarray:
+    """Identify a batch of chords by their pitch names.
+
+    Batch version of chordPitchNames for pitches spelled as music21 spells
+    pitch classes by default. The codes are the packed pitch classes.
+
+    Parameters
+    ----------
+        pcs : numpy.ndarray
+            Array of pitch classes with one chord per row.
+        divisions : int, optional
+            Number of divisions of the octave.
+        strings : bool, optional
+            Return the identity strings instead of the codes.
+
+    Return
+    ------
+        numpy.ndarray
+            Array with the identity of each chord.
+
+    Examples
+    --------
+    >>> from orbichord.identify import pitchNamesCodes
+    >>> pitchNamesCodes([[1, 5, 8]], strings = True)
+    array(['C#FG#'], dtype='<U5')
+    """
+    codes = pitchClassesCodes(pcs, divisions)
+    if not strings:
+        return codes
+    uniques, inverse = numpy.unique(codes, return_inverse=True)
+    names = numpy.array([
+        ''.join(
+            Pitch(pc).name if divisions == 12 else str(pc)
+            for pc in identityCode(
+                PitchClassesIdentity, int(code), divisions
+            ).pitchClasses()
+        ) for code in uniques
+    ], dtype=str)
+    return names[inverse.reshape(-1)]
+
+
+def symbolIndexCodes(
+    pcs: numpy.ndarray,
+    divisions: int = 12,
+    strings: bool = False
+) -> numpy.ndarray:
+    """Identify a batch of chords by their bass and pitch class set.
+
+    Batch version of chordSymbolIndexCode and chordSymbolIndex.
+
+    Parameters
+    ----------
+        pcs : numpy.ndarray
+            Array of pitch classes with one chord per row.
+        divisions : int, optional
+            Number of divisions of the octave (up to 58).
+        strings : bool, optional
+            Return the identity strings instead of the codes.
+
+    Return
+    ------
+        numpy.ndarray
+            Array with the identity of each chord.
+
+    Examples
+    --------
+    >>> from orbichord.identify import symbolIndexCodes
+    >>> symbolIndexCodes([[4, 0, 7, 4]], strings = True)
+    array(['<407>'], dtype='<U5')
+    """
+    pcs = numpy.asarray(pcs, dtype=numpy.int64)
+    bass = pcs[:, 0]
+    masks = numpy.bitwise_or.reduce(numpy.left_shift(1, pcs), axis=1)
+    codes = numpy.left_shift(bass, divisions) | \
+        (masks & ~numpy.left_shift(1, bass))
+    if strings:
+        return identityStrings(codes, SymbolIndexIdentity, divisions)
+    return codes
+
+
+def tClassCodes(
+    pcs: numpy.ndarray,
+    divisions: int = 12,
+    strings: bool = False
+) -> numpy.ndarray:
+    """Identify a batch of chords by their T-class.
+
+    Batch version of chordTClass.
+
+    Parameters
+    ----------
+        pcs : numpy.ndarray
+            Array of pitch classes with one chord per row.
+        divisions : int, optional
+            Number of divisions of the octave.
+        strings : bool, optional
+            Return the prime strings instead of the codes.
+
+    Return
+    ------
+        numpy.ndarray
+            Array with the identity of each chord.
+    """
+    codes = _setClassTables(divisions)[0][pitchClassSetCodes(pcs)]
+    if strings:
+        return identityStrings(codes, PitchClassSetIdentity, divisions)
+    return codes
+
+
+def tiClassCodes(
+    pcs: numpy.ndarray,
+    divisions: int = 12,
+    strings: bool = False
+) -> numpy.ndarray:
+    """Identify a batch of chords by their TI-class.
+
+    Batch version of chordTIClass and chordPrimeForm.
+
+    Parameters
+    ----------
+        pcs : numpy.ndarray
+            Array of pitch classes with one chord per row.
+        divisions : int, optional
+            Number of divisions of the octave.
+        strings : bool, optional
+            Return the prime form strings instead of the codes.
+
+    Return
+    ------
+        numpy.ndarray
+            Array with the identity of each chord.
+
+    Examples
+    --------
+    >>> from orbichord.identify import tiClassCodes
+    >>> tiClassCodes([[0, 4, 7], [7, 10, 2]], strings = True)
+    array(['<037>', '<037>'], dtype='<U5')
+    """
+    codes = _setClassTables(divisions)[1][pitchClassSetCodes(pcs)]
+    if strings:
+        return identityStrings(codes, PitchClassSetIdentity, divisions)
+    return codes
+
+
+def orbitCodes(
+    pcs: numpy.ndarray,
+    divisions: int = 12,
+    symmetries: str = 'OPTIC',
+    strings: bool = False
+) -> numpy.ndarray:
+    """Identify a batch of chords by their orbit under the symmetries.
+
+    Batch version of chordOT, chordOTI, chordOPT, chordOPTI, chordOPTC and
+    chordOPTIC (see orbitLabels).
+
+    Parameters
+    ----------
+        pcs : numpy.ndarray
+            Array of pitch classes with one chord per row.
+        divisions : int, optional
+            Number of divisions of the octave.
+        symmetries : str, optional
+            Letters of the symmetries.
+        strings : bool, optional
+            Return the identity strings instead of the codes.
+
+    Return
+    ------
+        numpy.ndarray
+            Array with the identity of each chord.
+
+    Examples
+    --------
+    >>> from orbichord.identify import orbitCodes
+    >>> orbitCodes([[0, 4, 7], [0, 8, 5]], symmetries = 'OTI', strings = True)
+    array(['<047>', '<047>'], dtype='<U5')
+    """
+    pcs = numpy.asarray(pcs, dtype=numpy.int64)
+    base = divisions**pcs.shape[1]
+    labels = orbitLabels(divisions, pcs.shape[1], symmetries)
+    codes = base + labels[pitchClassesCodes(pcs, divisions) - base]
+    if strings:
+        return identityStrings(codes, PitchClassesIdentity, divisions)
+    return codes
+
+
+# Map of identities to the function that compute their integer code
+# from the chord pitch classes.
+IDENTITY_CODES = {
+    chordOrderedPitchClasses: pitchClassSetCode,
+    chordPitchClasses: pitchClassesCode,
+    chordSymbolIndex: symbolIndexCode,
+    chordNormalForm: pitchClassSetCode,
+    chordPrimeForm: tiClassCode,
+    chordForteClass: tiClassCode
+}
+# String identities whose digits or names are only unique for twelve
+# divisions of the octave
+TWELVE_DIVISION_IDENTITIES = (
+    chordOrderedPitchClasses,
+    chordPitchClasses,
+    chordPitchNames,
+    chordSymbolIndex,
+    chordForteClass
+)
+# Identities that are already integer codes
+CODE_IDENTITIES = (
+    chordPitchClassSetCode,
+    chordPitchClassesCode,
+    chordSymbolIndexCode,
+    chordTClass,
+    chordTIClass,
+    chordOT,
+    chordOTI,
+    chordOPT,
+    chordOPTI,
+    chordOPTC,
+    chordOPTIC
+)
+# Map of identities to the function that compute the integer
+# codes of a batch of chords from their pitch classes.
+BATCH_IDENTITY_CODES = {
+    chordOrderedPitchClasses: pitchClassSetCodes,
+    chordPitchClassSetCode: pitchClassSetCodes,
+    chordPitchClasses: pitchClassesCodes,
+    chordPitchClassesCode: pitchClassesCodes,
+    chordSymbolIndex: symbolIndexCodes,
+    chordSymbolIndexCode: symbolIndexCodes,
+    chordNormalForm: pitchClassSetCodes,
+    chordPrimeForm: tiClassCodes,
+    chordForteClass: tiClassCodes,
+    chordTClass: tClassCodes,
+    chordTIClass: tiClassCodes,
+    chordOT: partial(orbitCodes, symmetries = 'OT'),
+    chordOTI: partial(orbitCodes, symmetries = 'OTI'),
+    chordOPT: partial(orbitCodes, symmetries = 'OPT'),
+    chordOPTI: partial(orbitCodes, symmetries = 'OPTI'),
+    chordOPTC: partial(orbitCodes, symmetries = 'OPTC'),
+    chordOPTIC: partial(orbitCodes, symmetries = 'OPTIC')
+}
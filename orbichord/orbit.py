@@ -0,0 +1,509 @@
+"""Enumerate canonical representatives of chord orbits."""
+
+import itertools
+from itertools import combinations_with_replacement
+from math import comb
+from random import Random
+from typing import Callable, Iterable, Iterator
+from orbichord.identify import \
+    chordNormalForm, \
+    chordOrderedPitchClasses, \
+    chordPitchClasses, \
+    chordPitchClassesCode, \
+    chordPitchClassSetCode, \
+    chordPitchNames, \
+    chordSymbolIndex, \
+    chordSymbolIndexCode
+
+
+def product(iterable: Iterable, dimension: int) -> Iterator[tuple]:
+    """Combine elements in ordered tuples (i.e. cartesian product).
+
+    Module level combinator for generating ordered chords, so chords are
+    not invariant under pitch class permutation (P).
+
+    Parameters
+    ----------
+        iterable : Iterable
+            Elements to combine.
+        dimension : int
+            Number of elements in each tuple.
+
+    Return
+    ------
+        Iterator[tuple]
+            Iterator to all ordered tuples of elements.
+    """
+    return itertools.product(iterable, repeat = dimension)
+
+
+def setOrbits(size: int, dimension: int) -> Iterator[tuple]:
+    """Enumerate the orbits of chords identified by their set of elements.
+
+    Each orbit is represented by the lexicographically smallest combination
+    with replacement, this is the tuple where the first element is repeated
+    as many times as needed and all the remaining elements are distinct.
+    The representatives are yielded in lexicographical order and the work is
+    proportional to the number of orbits.
+
+    Parameters
+    ----------
+        size : int
+            Number of elements to combine.
+        dimension : int
+            Number of elements in each tuple.
+
+    Yields
+    ------
+        tuple
+            Tuple of element indexes.
+
+    Examples
+    --------
+    >>> from orbichord.orbit import setOrbits
+    >>> list(setOrbits(3, 2))
+    [(0, 0), (0, 1), (0, 2), (1, 1), (1, 2), (2, 2)]
+    >>> list(setOrbits(3, 3))
+    [(0, 0, 0), (0, 0, 1), (0, 0, 2), (0, 1, 2), (1, 1, 1), (1, 1, 2), (2, 2, 2)]
+    """
+    prefix = []
+
+    def extend(repeating):
+        position = len(prefix)
+        if position == dimension:
+            yield tuple(prefix)
+            return
+        last = prefix[-1]
+        # Repeat the first element while no other was added
+        if repeating:
+            prefix.append(last)
+            yield from extend(True)
+            prefix.pop()
+        # Add a new larger element leaving room for the remaining ones
+        remaining = dimension - position - 1
+        for index in range(last + 1, size - remaining):
+            prefix.append(index)
+            yield from extend(False)
+            prefix.pop()
+
+    for index in range(size):
+        prefix.append(index)
+        yield from extend(True)
+        prefix.pop()
+
+
+def multisetOrbits(size: int, dimension: int) -> Iterator[tuple]:
+    """Enumerate the orbits of chords identified by their multiset.
+
+    Every combination with replacement is already a different orbit.
+
+    Parameters
+    ----------
+        size : int
+            Number of elements to combine.
+        dimension : int
+            Number of elements in each tuple.
+
+    Return
+    ------
+        Iterator[tuple]
+            Iterator to tuples of element indexes.
+    """
+    return combinations_with_replacement(range(size), dimension)
+
+
+def productSetOrbits(size: int, dimension: int) -> Iterator[tuple]:
+    """Enumerate the orbits of ordered tuples identified by their set.
+
+    The lexicographically smallest ordered tuple of each set is the same as
+    the smallest combination with replacement, and the orbits are the
+    same as the ones of setOrbits. However, orbits have different number
+    of ordered tuples and they are weighted differently (see
+    weightedRandomProductSetOrbit).
+
+    Parameters
+    ----------
+        size : int
+            Number of elements to combine.
+        dimension : int
+            Number of elements in each tuple.
+
+    Return
+    ------
+        Iterator[tuple]
+            Iterator to tuples of element indexes.
+    """
+    return setOrbits(size, dimension)
+
+
+def permutationOrbits(size: int, dimension: int) -> Iterator[tuple]:
+    """Enumerate the orbits of ordered tuples identified by their order.
+
+    Every ordered tuple is already a different orbit, these are the
+    distinct permutations of every multiset. They are yielded in
+    lexicographical order and without vetoing any tuple.
+
+    Parameters
+    ----------
+        size : int
+            Number of elements to combine.
+        dimension : int
+            Number of elements in each tuple.
+
+    Return
+    ------
+        Iterator[tuple]
+            Iterator to tuples of element indexes.
+
+    Examples
+    --------
+    >>> from orbichord.orbit import permutationOrbits
+    >>> list(permutationOrbits(2, 2))
+    [(0, 0), (0, 1), (1, 0), (1, 1)]
+    """
+    return product(range(size), dimension)
+
+
+def setOrbitCount(size: int, dimension: int) -> int:
+    """Count the orbits of chords identified by their set of elements.
+
+    Parameters
+    ----------
+        size : int
+            Number of elements to combine.
+        dimension : int
+            Number of elements in each tuple.
+
+    Return
+    ------
+        int
+            Number of non-empty subsets with at most dimension elements.
+
+    Examples
+    --------
+    >>> from orbichord.orbit import setOrbitCount
+    >>> setOrbitCount(12, 3)
+    298
+    """
+    return sum(comb(size, k) for k in range(1, min(size, dimension) + 1))
+
+
+def multisetOrbitCount(size: int, dimension: int) -> int:
+    """Count the orbits of chords identified by their multiset.
+
+    Parameters
+    ----------
+        size : int
+            Number of elements to combine.
+        dimension : int
+            Number of elements in each tuple.
+
+    Return
+    ------
+        int
+            Number of combinations with replacement.
+
+    Examples
+    --------
+    >>> from orbichord.orbit import multisetOrbitCount
+    >>> multisetOrbitCount(12, 3)
+    364
+    """
+    return comb(size + dimension - 1, dimension)
+
+
+def permutationOrbitCount(size: int, dimension: int) -> int:
+    """Count the orbits of ordered tuples identified by their order.
+
+    Parameters
+    ----------
+        size : int
+            Number of elements to combine.
+        dimension : int
+            Number of elements in each tuple.
+
+    Return
+    ------
+        int
+            Number of ordered tuples.
+
+    Examples
+    --------
+    >>> from orbichord.orbit import permutationOrbitCount
+    >>> permutationOrbitCount(12, 3)
+    1728
+    """
+    return size**dimension
+
+
+def randomSetOrbit(
+    size: int,
+    dimension: int,
+    random: Random
+) -> tuple:
+    """Draw uniformly an orbit of chords identified by their set of elements.
+
+    Parameters
+    ----------
+        size : int
+            Number of elements to combine.
+        dimension : int
+            Number of elements in each tuple.
+        random : Random
+            Random number generator.
+
+    Return
+    ------
+        tuple
+            The canonical tuple of element indexes of the orbit.
+    """
+    cardinalities = range(1, min(size, dimension) + 1)
+    cardinality, = random.choices(
+        cardinalities, [comb(size, k) for k in cardinalities]
+    )
+    indexes = sorted(random.sample(range(size), cardinality))
+    return (indexes[0],)*(dimension - cardinality) + tuple(indexes)
+
+
+def randomMultisetOrbit(
+    size: int,
+    dimension: int,
+    random: Random
+) -> tuple:
+    """Draw uniformly an orbit of chords identified by their multiset.
+
+    Parameters
+    ----------
+        size : int
+            Number of elements to combine.
+        dimension : int
+            Number of elements in each tuple.
+        random : Random
+            Random number generator.
+
+    Return
+    ------
+        tuple
+            The canonical tuple of element indexes of the orbit.
+    """
+    # Stars and bars bijection between multisets and subsets
+    indexes = sorted(random.sample(range(size + dimension - 1), dimension))
+    return tuple(index - position for position, index in enumerate(indexes))
+
+
+def weightedRandomSetOrbit(
+    size: int,
+    dimension: int,
+    random: Random
+) -> tuple:
+    """Draw an orbit of chords identified by their set of elements.
+
+    The orbits are drawn with probability proportional to their number of
+    combinations with replacement.
+
+    Parameters
+    ----------
+        size : int
+            Number of elements to combine.
+        dimension : int
+            Number of elements in each tuple.
+        random : Random
+            Random number generator.
+
+    Return
+    ------
+        tuple
+            The canonical tuple of element indexes of the orbit.
+    """
+    indexes = sorted(set(randomMultisetOrbit(size, dimension, random)))
+    return (indexes[0],)*(dimension - len(indexes)) + tuple(indexes)
+
+
+def randomPermutationOrbit(
+    size: int,
+    dimension: int,
+    random: Random
+) -> tuple:
+    """Draw uniformly an orbit of ordered tuples identified by their order.
+
+    Parameters
+    ----------
+        size : int
+            Number of elements to combine.
+        dimension : int
+            Number of elements in each tuple.
+        random : Random
+            Random number generator.
+
+    Return
+    ------
+        tuple
+            The tuple of element indexes of the orbit.
+    """
+    return tuple(random.randrange(size) for _ in range(dimension))
+
+
+def weightedRandomProductSetOrbit(
+    size: int,
+    dimension: int,
+    random: Random
+) -> tuple:
+    """Draw an orbit of ordered tuples identified by their set of elements.
+
+    The orbits are drawn with probability proportional to their number of
+    ordered tuples.
+
+    Parameters
+    ----------
+        size : int
+            Number of elements to combine.
+        dimension : int
+            Number of elements in each tuple.
+        random : Random
+            Random number generator.
+
+    Return
+    ------
+        tuple
+            The canonical tuple of element indexes of the orbit.
+    """
+    indexes = sorted(set(randomPermutationOrbit(size, dimension, random)))
+    return (indexes[0],)*(dimension - len(indexes)) + tuple(indexes)
+
+
+# Map of orbit enumerations to the functions that count
+# their orbits and draw random orbits.
+ORBIT_COUNTS = {
+    setOrbits: setOrbitCount,
+    multisetOrbits: multisetOrbitCount,
+    productSetOrbits: setOrbitCount,
+    permutationOrbits: permutationOrbitCount
+}
+RANDOM_ORBITS = {
+    setOrbits: randomSetOrbit,
+    multisetOrbits: randomMultisetOrbit,
+    productSetOrbits: randomSetOrbit,
+    permutationOrbits: randomPermutationOrbit
+}
+WEIGHTED_RANDOM_ORBITS = {
+    setOrbits: weightedRandomSetOrbit,
+    multisetOrbits: randomMultisetOrbit,
+    productSetOrbits: weightedRandomProductSetOrbit,
+    permutationOrbits: randomPermutationOrbit
+}
+
+# Map of built-in identities to the orbit enumeration of combinations
+# with replacement and the pitch attribute that has to be unique.
+COMBINATION_ORBITS = {
+    chordOrderedPitchClasses: (setOrbits, 'pitchClass'),
+    chordSymbolIndex: (setOrbits, 'pitchClass'),
+    chordPitchClasses: (multisetOrbits, 'pitchClass'),
+    chordPitchNames: (multisetOrbits, 'name'),
+    chordPitchClassSetCode: (setOrbits, 'pitchClass'),
+    chordSymbolIndexCode: (setOrbits, 'pitchClass'),
+    chordPitchClassesCode: (multisetOrbits, 'pitchClass'),
+    chordNormalForm: (setOrbits, 'pitchClass')
+}
+# Map of built-in identities to the orbit enumeration of ordered
+# tuples and the pitch attribute that has to be unique.
+PRODUCT_ORBITS = {
+    chordOrderedPitchClasses: (productSetOrbits, 'pitchClass'),
+    chordPitchClassSetCode: (productSetOrbits, 'pitchClass'),
+    chordNormalForm: (productSetOrbits, 'pitchClass'),
+    chordPitchClasses: (permutationOrbits, 'pitchClass'),
+    chordPitchNames: (permutationOrbits, 'name'),
+    chordPitchClassesCode: (permutationOrbits, 'pitchClass')
+}
+# Map of combinators to their orbit enumerations
+COMBINATOR_ORBITS = {
+    combinations_with_replacement: COMBINATION_ORBITS,
+    product: PRODUCT_ORBITS
+}
+
+
+def orbitEnumeration(
+    pitches: list,
+    combinator: Callable[[Iterable, int], Iterator] =\
+        combinations_with_replacement,
+    identify: Callable = chordOrderedPitchClasses
+) -> Callable[[int, int], Iterator[tuple]]:
+    """Return the canonical orbit enumeration for the generator arguments.
+
+    Parameters
+    ----------
+        pitches : list
+            List of music21.pitch.Pitch.
+        combinator : Callable[[Iterable, int], Iterator], optional
+            Iterator function to generate all chord combinations.
+        identify : Callable[Chord, str], optional
+            Funtion to indentify chords.
+
+    Return
+    ------
+        Callable[[int, int], Iterator[tuple]]
+            Orbit enumeration function (e.g. setOrbits).
+
+    Raises
+    ------
+        ValueError
+            if there is no canonical enumeration for the combinator and
+            identify function, or if pitches are not unique.
+    """
+    if combinator not in COMBINATOR_ORBITS:
+        raise ValueError(
+            'No canonical enumeration for combinator {}.'.format(
+            getattr(combinator, '__name__', combinator)
+        ))
+    combinator_orbits = COMBINATOR_ORBITS[combinator]
+    if identify not in combinator_orbits:
+        raise ValueError(
+            'No canonical enumeration for identify function {}.'.format(
+            getattr(identify, '__name__', identify)
+        ))
+    orbits, attribute = combinator_orbits[identify]
+    values = [getattr(pitch, attribute) for pitch in pitches]
+    if len(set(values)) != len(values):
+        raise ValueError(
+            'Canonical enumeration requires pitches with unique {}.'.format(
+            attribute
+        ))
+    return orbits
+
+
+def canonicalOrbits(
+    pitches: list,
+    dimension: int,
+    combinator: Callable[[Iterable, int], Iterator] =\
+        combinations_with_replacement,
+    identify: Callable = chordOrderedPitchClasses
+) -> Iterator[tuple]:
+    """Enumerate a canonical tuple of pitch indexes for each chord orbit.
+
+    The tuples are the indexes of the first occurrence of each chord
+    identity when iterating over the combinator, and they come in the same
+    order.
+
+    Parameters
+    ----------
+        pitches : list
+            List of music21.pitch.Pitch.
+        dimension : int
+            Dimension of the space.
+        combinator : Callable[[Iterable, int], Iterator], optional
+            Iterator function to generate all chord combinations.
+        identify : Callable[Chord, str], optional
+            Funtion to indentify chords.
+
+    Return
+    ------
+        Iterator[tuple]
+            Iterator to tuples of pitch indexes, one for each orbit.
+
+    Raises
+    ------
+        ValueError
+            if there is no canonical enumeration for the combinator and
+            identify function, or if pitches are not unique.
+    """
+    orbits = orbitEnumeration(pitches, combinator, identify)
+    return orbits(len(pitches), dimension)
@@ -0,0 +1,222 @@
+"""Define a set of vectorized functions to select batches of chords.
+
+Batch select functions take an array with the pitch classes of a chord
+per row and return a boolean mask with the selected rows. Select functions
+are defined for twelve pitch classes and only depend on the pitch classes
+and not on the pitch spelling.
+"""
+
+from functools import lru_cache
+import numpy
+from orbichord.identify import _intervalVectorTable, pitchClassSetCodes
+from orbichord.maps import SYMBOL_INDEX_TO_FIGURE
+from typing import Callable
+
+# Triad and seventh chord pitch classes with root in C
+TRIADS = (
+    (0, 4, 7), (0, 3, 7), (0, 3, 6), (0, 4, 8)
+)
+SEVENTHS = (
+    (0, 4, 7, 11), (0, 4, 7, 10), (0, 3, 7, 10), (0, 3, 7, 11),
+    (0, 3, 6, 10), (0, 3, 6, 9), (0, 4, 8, 11), (0, 4, 8, 10)
+)
+
+
+def pitchClassMasks(pcs: numpy.ndarray) -> numpy.ndarray:
+    """Compute the bit mask of the pitch class set of each chord.
+
+    Same as orbichord.identify.pitchClassSetCodes for twelve divisions.
+
+    Parameters
+    ----------
+        pcs : numpy.ndarray
+            Array of pitch classes with one chord per row.
+
+    Return
+    ------
+        numpy.ndarray
+            Array with the mask of each chord.
+
+    Examples
+    --------
+    >>> import numpy
+    >>> from orbichord.selection import pitchClassMasks
+    >>> pitchClassMasks(numpy.array([[0, 4, 7], [7, 0, 0]]))
+    array([145, 129])
+    """
+    return pitchClassSetCodes(pcs, divisions = 12)
+
+
+def _chordMasks(chords: tuple) -> set:
+    """Return the masks of all transpositions of the chords."""
+    masks = set()
+    for chord in chords:
+        for transposition in range(12):
+            masks.add(sum(1 << ((pc + transposition) % 12) for pc in chord))
+    return masks
+
+
+@lru_cache(maxsize=None)
+def _maskTable(chords: tuple) -> numpy.ndarray:
+    """Return a boolean table over all masks set for the chords."""
+    table = numpy.zeros(4096, dtype=bool)
+    table[list(_chordMasks(chords))] = True
+    return table
+
+
+@lru_cache(maxsize=None)
+def _symbolTable() -> numpy.ndarray:
+    """Return a boolean table over all chord symbol keys.
+
+    The key of a chord symbol index is its bass pitch class times 4096 plus
+    the mask of the remaining pitch classes.
+    """
+    return SYMBOL_INDEX_TO_FIGURE.positions >= 0
+
+
+class _MaskSelect:
+    """Picklable batch select function based on a table over masks."""
+
+    def __init__(self, table: numpy.ndarray):
+        """Constructor."""
+        self._table = table
+
+    def __call__(self, pcs: numpy.ndarray) -> numpy.ndarray:
+        """Return the boolean mask with the selected chords."""
+        return self._table[pitchClassMasks(pcs)]
+
+
+def areTriads(pcs: numpy.ndarray) -> numpy.ndarray:
+    """Select major, minor, diminished and augmented triads.
+
+    Parameters
+    ----------
+        pcs : numpy.ndarray
+            Array of pitch classes with one chord per row.
+
+    Return
+    ------
+        numpy.ndarray
+            Boolean mask with the selected chords.
+
+    Examples
+    --------
+    >>> from orbichord.selection import areTriads
+    >>> areTriads([[0, 4, 7], [0, 0, 4], [7, 2, 11]])
+    array([ True, False,  True])
+    """
+    return _maskTable(TRIADS)[pitchClassMasks(pcs)]
+
+
+def areSevenths(pcs: numpy.ndarray) -> numpy.ndarray:
+    """Select seventh chords.
+
+    Parameters
+    ----------
+        pcs : numpy.ndarray
+            Array of pitch classes with one chord per row.
+
+    Return
+    ------
+        numpy.ndarray
+            Boolean mask with the selected chords.
+    """
+    return _maskTable(SEVENTHS)[pitchClassMasks(pcs)]
+
+
+def haveChordSymbolFigure(pcs: numpy.ndarray) -> numpy.ndarray:
+    """Select chords with chord symbol figure.
+
+    Vectorized version of orbichord.symbol.hasChordSymbolFigure.
+
+    Parameters
+    ----------
+        pcs : numpy.ndarray
+            Array of pitch classes with one chord per row.
+
+    Return
+    ------
+        numpy.ndarray
+            Boolean mask with the selected chords.
+    """
+    pcs = numpy.asarray(pcs, dtype=numpy.int64)
+    bass = pcs[:, 0]
+    masks = pitchClassMasks(pcs) & ~numpy.left_shift(1, bass)
+    return _symbolTable()[4096*bass + masks]
+
+
+def intervalVectors(pcs: numpy.ndarray) -> numpy.ndarray:
+    """Compute the interval vector of each chord.
+
+    Parameters
+    ----------
+        pcs : numpy.ndarray
+            Array of pitch classes with one chord per row.
+
+    Return
+    ------
+        numpy.ndarray
+            Array with the six interval class counts per chord.
+
+    Examples
+    --------
+    >>> from orbichord.selection import intervalVectors
+    >>> intervalVectors([[0, 4, 7]])
+    array([[0, 0, 1, 1, 1, 0]])
+    """
+    return _intervalVectorTable(divisions = 12)[pitchClassMasks(pcs)]
+
+
+def haveCardinality(cardinality: int) -> Callable:
+    """Return a function to select chords by pitch class cardinality.
+
+    Parameters
+    ----------
+        cardinality : int
+            Number of unique pitch classes.
+
+    Return
+    ------
+        Callable[[numpy.ndarray], numpy.ndarray]
+            Batch select function.
+    """
+    table = numpy.array([
+        bin(mask).count('1') == cardinality for mask in range(4096)
+    ])
+    return _MaskSelect(table)
+
+
+def haveIntervalVector(vector: list) -> Callable:
+    """Return a function to select chords by interval vector.
+
+    Parameters
+    ----------
+        vector : list
+            The six interval class counts.
+
+    Return
+    ------
+        Callable[[numpy.ndarray], numpy.ndarray]
+            Batch select function.
+    """
+    table = numpy.all(
+        _intervalVectorTable(divisions = 12) == numpy.asarray(vector), axis=1
+    )
+    return _MaskSelect(table)
+
+
+def haveIntervalClass(interval: int) -> Callable:
+    """Return a function to select chords containing an interval class.
+
+    Parameters
+    ----------
+        interval : int
+            Interval class between 1 and 6.
+
+    Return
+    ------
+        Callable[[numpy.ndarray], numpy.ndarray]
+            Batch select function.
+    """
+    table = _intervalVectorTable(divisions = 12)[:, interval - 1] > 0
+    return _MaskSelect(table)
@@ -0,0 +1,413 @@
+"""Implement stores of chord identities used to veto repeated chords."""
+
+from array import array
+import hashlib
+import os
+import sqlite3
+import tempfile
+from orbichord.identify import IDENTITY_CODES, identityCodeSize
+from typing import Callable, Hashable
+
+# Approximated number of bytes used per identity in a python set
+SET_ITEM_BYTES = 100
+# Maximum number of bytes used per identity in an integer store
+INTEGER_ITEM_BYTES = 32
+# Maximum number of bytes used by a bitset when there is no memory budget
+BITSET_MAX_BYTES = 1 << 24
+
+
+class SetStore:
+    """Store identities in a python set.
+
+    Examples
+    --------
+    >>> from orbichord.store import SetStore
+    >>> store = SetStore()
+    >>> store.add('<047>'), store.add('<047>'), len(store)
+    (True, False, 1)
+    """
+
+    def __init__(self):
+        """Constructor."""
+        self._keys = set()
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Return true if the key is in the store."""
+        return key in self._keys
+
+    def __len__(self) -> int:
+        """Return the number of keys in the store."""
+        return len(self._keys)
+
+    def add(self, key: Hashable) -> bool:
+        """Add a key to the store.
+
+        Parameters
+        ----------
+            key : Hashable
+                Key to be added.
+
+        Return
+        ------
+            bool
+                True if the key was not in the store.
+        """
+        if key in self._keys:
+            return False
+        self._keys.add(key)
+        return True
+
+
+class BitsetStore:
+    """Store integer identity codes in a bitset.
+
+    Parameters
+    ----------
+        size : int
+            Upper bound of the integer codes.
+
+    Examples
+    --------
+    >>> from orbichord.store import BitsetStore
+    >>> store = BitsetStore(4096)
+    >>> store.add(145), store.add(145), 145 in store, 146 in store
+    (True, False, True, False)
+    """
+
+    def __init__(self, size: int):
+        """Constructor."""
+        self._bits = bytearray((size + 7) >> 3)
+        self._size = 0
+
+    def __contains__(self, key: int) -> bool:
+        """Return true if the key is in the store."""
+        return bool(self._bits[key >> 3] & (1 << (key & 7)))
+
+    def __len__(self) -> int:
+        """Return the number of keys in the store."""
+        return self._size
+
+    def add(self, key: int) -> bool:
+        """Add a key to the store.
+
+        Parameters
+        ----------
+            key : int
+                Key to be added.
+
+        Return
+        ------
+            bool
+                True if the key was not in the store.
+        """
+        index = key >> 3
+        bit = 1 << (key & 7)
+        bits = self._bits[index]
+        if bits & bit:
+            return False
+        self._bits[index] = bits | bit
+        self._size += 1
+        return True
+
+
+class IntegerStore:
+    """Store non-negative integer identity codes in a hash table.
+
+    The codes are stored in an array of 64-bit integers with open
+    addressing and linear probing. The table doubles its size when it is
+    half full, so it uses between 16 and 32 bytes per code.
+
+    Parameters
+    ----------
+        capacity : int, optional
+            Initial number of codes that fit in the table.
+
+    Examples
+    --------
+    >>> from orbichord.store import IntegerStore
+    >>> store = IntegerStore()
+    >>> store.add(1 << 40), store.add(1 << 40), (1 << 40) in store, 7 in store
+    (True, False, True, False)
+    """
+
+    # Multiplier of the Fibonacci hashing of the codes
+    _MULTIPLIER = 11400714819323198485
+
+    def __init__(self, capacity: int = 1024):
+        """Constructor."""
+        bits = max(2*capacity - 1, 1).bit_length()
+        self._table = array('q', [-1]) * (1 << bits)
+        self._shift = 64 - bits
+        self._size = 0
+
+    def __contains__(self, key: int) -> bool:
+        """Return true if the key is in the store."""
+        return self._table[self._slot(key)] == key
+
+    def __iter__(self):
+        """Iterate over the keys in the store."""
+        return (key for key in self._table if key >= 0)
+
+    def __len__(self) -> int:
+        """Return the number of keys in the store."""
+        return self._size
+
+    def _slot(self, key: int) -> int:
+        """Return the slot of the key or the empty slot where it goes."""
+        table = self._table
+        mask = len(table) - 1
+        index = ((key * self._MULTIPLIER) & 0xFFFFFFFFFFFFFFFF) >> self._shift
+        while True:
+            value = table[index]
+            if value == key or value < 0:
+                return index
+            index = (index + 1) & mask
+
+    def _grow(self):
+        """Double the size of the table."""
+        keys = self._table
+        self._table = array('q', [-1]) * (2*len(keys))
+        self._shift -= 1
+        for key in keys:
+            if key >= 0:
+                self._table[self._slot(key)] = key
+
+    def add(self, key: int) -> bool:
+        """Add a key to the store.
+
+        Parameters
+        ----------
+            key : int
+                Non-negative key to be added.
+
+        Return
+        ------
+            bool
+                True if the key was not in the store.
+        """
+        key = int(key)
+        index = self._slot(key)
+        if self._table[index] == key:
+            return False
+        self._table[index] = key
+        self._size += 1
+        if 2*self._size > len(self._table):
+            self._grow()
+        return True
+
+
+class SpillStore:
+    """Store identities in memory up to a maximum and then spill to disk.
+
+    Once the maximum number of keys in memory is reached, all keys are
+    moved to a sqlite database in a temporary file. Keys are then checked
+    with a Bloom filter kept in memory and only verified in the database
+    when the filter reports them as possibly present. The Bloom filter is
+    only allocated when the keys are spilled. It does not grow, so it is
+    only effective up to about one key per ten bits. Beyond that most keys
+    are verified in the database and adding keys becomes slower.
+
+    Parameters
+    ----------
+        capacity : int
+            Maximum number of keys kept in memory.
+        directory : str, optional
+            Directory for the temporary database.
+        bloom_bits : int, optional
+            Number of bits of the Bloom filter (by default 16 per capacity,
+            see identityStore to size it from a memory budget).
+        bloom_hashes : int, optional
+            Number of hashes of the Bloom filter.
+        integer : bool, optional
+            Keys are non-negative integers kept in memory in an
+            IntegerStore instead of a python set.
+
+    Examples
+    --------
+    >>> from orbichord.store import SpillStore
+    >>> store = SpillStore(capacity = 2)
+    >>> [store.add(key) for key in (1, 2, 3, 1, 3, 4)]
+    [True, True, True, False, False, True]
+    >>> len(store)
+    4
+    """
+
+    def __init__(self,
+        capacity: int,
+        directory: str = None,
+        bloom_bits: int = None,
+        bloom_hashes: int = 4,
+        integer: bool = False
+    ):
+        """Constructor."""
+        self._capacity = capacity
+        self._directory = directory
+        self._integer = integer
+        self._keys = IntegerStore() if integer else set()
+        self._size = 0
+        self._database = None
+        self._path = None
+        self._bloom = None
+        self._bloom_bits = bloom_bits or 16*capacity
+        self._bloom_hashes = bloom_hashes
+
+    def __del__(self):
+        """Remove the temporary database."""
+        self.close()
+
+    def __contains__(self, key: Hashable) -> bool:
+        """Return true if the key is in the store."""
+        if self._integer:
+            key = int(key)
+        if self._database is None:
+            return key in self._keys
+        return self._contains(key, self._bloomBits(key))
+
+    def __len__(self) -> int:
+        """Return the number of keys in the store."""
+        return self._size
+
+    @property
+    def spilled(self):
+        """Return true if keys are stored on disk."""
+        return self._database is not None
+
+    def close(self):
+        """Close and remove the temporary database."""
+        if getattr(self, '_database', None) is not None:
+            self._database.close()
+            self._database = None
+            os.remove(self._path)
+
+    def _bloomBits(self, key: Hashable) -> list:
+        """Return the Bloom filter bits of a key."""
+        digest = hashlib.blake2b(
+            repr(key).encode('utf-8'), digest_size = 8*self._bloom_hashes
+        ).digest()
+        size = len(self._bloom) << 3
+        return [
+            int.from_bytes(digest[8*index:8*index+8], 'little') % size
+            for index in range(self._bloom_hashes)
+        ]
+
+    def _contains(self, key: Hashable, bits: list) -> bool:
+        """Return true if the key is in the database."""
+        for bit in bits:
+            if not self._bloom[bit >> 3] & (1 << (bit & 7)):
+                return False
+        cursor = self._database.execute(
+            'SELECT 1 FROM keys WHERE key = ?', (repr(key),)
+        )
+        return cursor.fetchone() is not None
+
+    def _insert(self, key: Hashable, bits: list):
+        """Insert a key in the database and the Bloom filter."""
+        for bit in bits:
+            self._bloom[bit >> 3] |= 1 << (bit & 7)
+        self._database.execute(
+            'INSERT INTO keys VALUES (?)', (repr(key),)
+        )
+
+    def _spill(self):
+        """Move the keys in memory to the database."""
+        descriptor, self._path = tempfile.mkstemp(
+            suffix = '.sqlite', dir = self._directory
+        )
+        os.close(descriptor)
+        self._bloom = bytearray((self._bloom_bits + 7) >> 3)
+        self._database = sqlite3.connect(self._path)
+        self._database.execute('PRAGMA journal_mode = OFF')
+        self._database.execute('PRAGMA synchronous = OFF')
+        self._database.execute('CREATE TABLE keys (key TEXT PRIMARY KEY)')
+        for key in self._keys:
+            self._insert(key, self._bloomBits(key))
+        self._keys = None
+
+    def add(self, key: Hashable) -> bool:
+        """Add a key to the store.
+
+        Parameters
+        ----------
+            key : Hashable
+                Key to be added.
+
+        Return
+        ------
+            bool
+                True if the key was not in the store.
+        """
+        if self._integer:
+            key = int(key)
+        if self._database is None:
+            if key in self._keys:
+                return False
+            self._keys.add(key)
+            self._size += 1
+            if self._size > self._capacity:
+                self._spill()
+            return True
+        bits = self._bloomBits(key)
+        if self._contains(key, bits):
+            return False
+        self._insert(key, bits)
+        self._size += 1
+        return True
+
+
+def identityStore(
+    identify: Callable,
+    dimension: int,
+    memory_budget: int = None,
+    directory: str = None,
+    divisions: int = 12
+):
+    """Create the most compact store for chord identities.
+
+    Identities with integer codes are stored in a bitset when it fits
+    in the memory budget, or otherwise in a hash table of integers.
+    Other identities are stored in a python set. If there is a memory
+    budget, the identities that are not in a bitset are stored in a store
+    that spills to disk, where half of the budget is used by the keys kept
+    in memory and the other half by the Bloom filter of the spilled keys.
+
+    Parameters
+    ----------
+        identify : Callable[[Chord], str]
+            Funtion to indentify chords.
+        dimension : int
+            Number of pitches in the chords.
+        memory_budget : int, optional
+            Approximated maximum number of bytes used by the store.
+        directory : str, optional
+            Directory for the temporary database.
+        divisions : int, optional
+            Number of divisions of the octave.
+
+    Return
+    ------
+        tuple
+            Function that maps chord to keys and the store.
+    """
+    key = lambda chord: chord.identity
+    size = identityCodeSize(identify, dimension, divisions)
+    if identify in IDENTITY_CODES:
+        # Codes computed from pitch classes are for twelve divisions
+        if divisions == 12:
+            code = IDENTITY_CODES[identify]
+            key = lambda chord: code(chord.pitchClasses)
+        else:
+            size = None
+    if size is not None:
+        if size >> 3 <= (memory_budget or BITSET_MAX_BYTES):
+            return key, BitsetStore(size)
+        if memory_budget is None:
+            return key, IntegerStore()
+        item_bytes = INTEGER_ITEM_BYTES
+    else:
+        if memory_budget is None:
+            return key, SetStore()
+        item_bytes = SET_ITEM_BYTES
+    return key, SpillStore(
+        max(memory_budget // (2*item_bytes), 1), directory,
+        bloom_bits = 4*memory_budget, integer = size is not None
+    )
@@ -2,7 +2,7 @@
 
 from copy import deepcopy
 from music21.chord import Chord
-from orbichord.identify import chordSymbolIndex
+from orbichord.identify import symbolIndexCode
 from orbichord.maps import SYMBOL_INDEX_TO_FIGURE
 
 
@@ -21,8 +21,7 @@ def hasChordSymbolFigure(chord : Chord) -> bool:
         bool:
             Return if symbol figure exist (named chord).
     """
-    key = chordSymbolIndex(chord)
-    return key in SYMBOL_INDEX_TO_FIGURE
+    return hasChordSymbolCode(symbolIndexCode(chord.pitchClasses))
 
 
 def chordSymbolFigure(
@@ -48,12 +47,64 @@ def chordSymbolFigure(
         str
             A string with with the chord symbol figure.
     """
-    key = chordSymbolIndex(chord)
-    if key not in SYMBOL_INDEX_TO_FIGURE:
+    code = symbolIndexCode(chord.pitchClasses)
+    if code not in SYMBOL_INDEX_TO_FIGURE:
         return chord.pitchClasses
-    figure, inversions = SYMBOL_INDEX_TO_FIGURE[key]
-    if inversion is None:
-        return figure[enharmonic]
-    key = inversions[inversion]
-    figure, _ = SYMBOL_INDEX_TO_FIGURE[key]
-    return figure[enharmonic]
+    return chordSymbolCodeFigure(code, inversion, enharmonic)
+
+
+def hasChordSymbolCode(code : int) -> bool:
+    """Return true if the chord symbol index code has figure.
+
+    Integer version of hasChordSymbolFigure.
+
+    Parameters
+    ----------
+        code : int
+            Chord symbol index code (see orbichord.identify.symbolIndexCode).
+
+    Return
+    ------
+        bool:
+            Return if symbol figure exist (named chord).
+    """
+    return code in SYMBOL_INDEX_TO_FIGURE
+
+
+def chordSymbolCodeFigure(
+        code : int,
+        inversion : int = None,
+        enharmonic : int = 0
+    ) -> str:
+    """Return the chord symbol figure of a chord symbol index code.
+
+    Integer version of chordSymbolFigure.
+
+    Parameters
+    ----------
+        code : int
+            Chord symbol index code (see orbichord.identify.symbolIndexCode).
+        inversion : int, optional
+            Inversion index.
+        enharmonic : int, optional
+            Enharmonic index
+
+    Return
+    ------
+        str
+            A string with with the chord symbol figure.
+
+    Raises
+    ------
+        KeyError
+            if the code has no chord symbol figure.
+
+    Examples
+    --------
+    >>> from orbichord.symbol import chordSymbolCodeFigure
+    >>> chordSymbolCodeFigure(4*4096 + 129, inversion = 0)
+    'C'
+    """
+    if inversion is not None:
+        code = SYMBOL_INDEX_TO_FIGURE.inversions(code)[inversion]
+    return SYMBOL_INDEX_TO_FIGURE.figures(code)[enharmonic]
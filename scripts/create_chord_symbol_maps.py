@@ -1,12 +1,11 @@
-"""Create maps used by orbichord.identify module."""
+"""Create maps used by orbichord.symbol module."""
 
 from collections import OrderedDict
 import music21.chord
 from music21.scale import ChromaticScale
 import music21.harmony as harmony
 from orbichord.identify import chordSymbolIndex
-
-from pprint import pprint
+from orbichord.maps import writeSymbolFigureMap
 
 chords = OrderedDict()
 
@@ -48,10 +47,4 @@ for add1 in range(13):
                 chords[key][1] = inversions
 
 # Save in file
-with open('maps.py', 'w') as file:
-    pprint(
-        chords,
-        stream = file,
-        width = 300,
-        indent = 4
-    )
+writeSymbolFigureMap('maps.bin', chords.items())
@@ -0,0 +1,148 @@
+import gc
+from music21.chord import Chord
+from music21.pitch import Pitch
+from music21.scale import MajorScale
+from numpy import inf
+from numpy import linalg as la
+import os
+import pickle
+import pytest
+import subprocess
+import sys
+from orbichord.chord import *
+from orbichord.chordinate import EfficientVoiceLeading, scalePoint
+from orbichord.graph import createGraph
+from orbichord.identify import \
+    chordPitchClassesCode, \
+    chordPitchClassSetCode, \
+    chordPitchNames, \
+    chordSymbolIndex
+from orbichord.symbol import chordSymbolFigure
+
+
+def test_IdentifiedChord():
+    """Test IdentifiedChord orbichord.chord module class."""
+    calls = []
+
+    def identify(chord):
+        calls.append(chord)
+        return chordPitchNames(chord)
+
+    chord = IdentifiedChord(identify = identify, notes = 'C4 E4 G4')
+    chords = {chord}
+    assert chord in chords and hash(chord) == hash(chord)
+    assert chord.identity == 'CEG' and len(calls) == 1
+    chord.add('B4')
+    assert chord.identity == 'CEGB'
+    chord[0] = 'D4'
+    assert chord.identity == 'DEGB'
+    chord.remove(chord.pitches[-1])
+    assert chord.identity == 'DEG' and len(calls) == 4
+    chord.pitches = [Pitch('E4'), Pitch('B4'), Pitch('G#4')]
+    assert chord.identity == 'EBG#' and len(calls) == 5
+    assert hash(chord) == hash(chord.identity)
+    assert chord.identity == 'EBG#' and len(calls) == 5
+    # In place modifications require clearing the cache
+    chord.pitches[0].name = 'F'
+    chord.clearCache()
+    assert chord.identity == 'FBG#' and len(calls) == 6
+
+def test_ChordValue():
+    """Test ChordValue orbichord.chord module class."""
+    chord = ChordValue((0, 4, 7), (4, 4, 5))
+    music21_chord = chord.toChord()
+    assert music21_chord.fullName == Chord('C4 E4 G5').fullName
+    assert chord.identity == '<047>'
+    assert chord == IdentifiedChord(notes = 'C4 E4 G4')
+    assert ChordValue.fromChord(music21_chord) == chord
+    assert ChordValue.fromChord(music21_chord).octaves == (4, 4, 5)
+    assert chord.isTriad()
+    assert pickle.loads(pickle.dumps(chord)).identity == chord.identity
+    with pytest.raises(AttributeError):
+        chord.octaves = (3, 3, 3)
+
+    assert chordPitchNames(chord) == 'CEG'
+    assert chordSymbolIndex(chord) == '<047>'
+    assert chordSymbolFigure(chord) == 'C'
+    scale = MajorScale('C')
+    assert scalePoint(chord, scale) == [0, 2, 4]
+    voice_leading = EfficientVoiceLeading(
+        scale = scale,
+        metric = lambda delta: la.norm(delta, inf)
+    )
+    _, distance = voice_leading(chord, ChordValue((7, 11, 2)))
+    assert distance == 1.0
+
+    class Chords:
+        def run(self):
+            return iter([chord, ChordValue((9, 0, 4)), ChordValue((7, 11, 2))])
+
+    graph, _ = createGraph(Chords(), voice_leading, lambda x: x == 1.0)
+    assert sorted(graph.nodes) == ['<047>', '<049>', '<27B>']
+    assert len(graph.edges) == 3
+
+    chord = ChordValue((0, 6, 13), divisions = 24)
+    assert chord.pitchNames == ['0', '6', '13']
+    assert chord.toChord().pitches[1].ps == 63
+
+
+def test_chord_equality():
+    """Test exact equality of orbichord.chord module classes."""
+    chords = [
+        IdentifiedChord(identify = chordPitchClassSetCode, notes = 'C E G'),
+        ChordValue((7, 4, 0), identify = chordPitchClassSetCode)
+    ]
+    assert chords[0] == chords[1] and chords[1] == chords[0]
+    assert chords[0].identity == 145
+    assert chords[0] != IdentifiedChord(notes = 'C E G')
+    assert len(set(chords)) == 1
+    chords.append(
+        IdentifiedChord(identify = chordPitchClassesCode, notes = 'C C#')
+    )
+    assert chords[0] != chords[2] and len(set(chords)) == 2
+    assert isinstance(ChordValue((0, 40), divisions = 53).digest, int)
+
+
+def test_ChordRegistry():
+    """Test ChordRegistry orbichord.chord module class."""
+    registry = ChordRegistry(maxsize = 2)
+    C = registry.intern(ChordValue((0, 4, 7)))
+    assert registry.intern(ChordValue.fromChord(
+        IdentifiedChord(notes = 'E4 G4 C5')
+    )) is C
+    assert IdentifiedChord(notes = 'C4 E4 G4') in registry
+    with pytest.raises(TypeError):
+        registry.intern(IdentifiedChord(notes = 'C4 E4 G4'))
+    chords = [registry.intern(ChordValue((0, pc))) for pc in range(1, 12)]
+    assert registry.intern(ChordValue((0, 5))) is chords[4]
+    del chords
+    gc.collect()
+    assert len(registry) == 3
+    registry.clear()
+    assert len(registry) == 0
+
+
+def test_chord_pickle():
+    """Test pickling and digest of orbichord.chord module classes."""
+    chords = [
+        IdentifiedChord(notes = 'C4 E4 G4'),
+        CompactChord((Pitch('C'), Pitch('E'), Pitch('G')), (4, 4, 4)),
+        ChordValue((0, 4, 7), identify = chordPitchClassSetCode)
+    ]
+    chords[1].isTriad()
+    for chord in chords:
+        copy = pickle.loads(pickle.dumps(chord))
+        assert copy == chord and copy.digest == chord.digest
+    assert len(pickle.dumps(chords[1])) < len(pickle.dumps(chords[1].chord))
+    assert chords[0].digest == chords[1].digest == chords[2].digest
+    # Digests are the same across processes with hash randomization
+    digests = {
+        subprocess.run([
+            sys.executable, '-c',
+            'from orbichord.identify import identityDigest;'
+            'print(hash("<047>"), identityDigest("<047>"))'
+        ], env = dict(os.environ, PYTHONHASHSEED = seed),
+        capture_output = True, text = True, check = True
+        ).stdout.split()[1] for seed in ('1', '2')
+    }
+    assert digests == {str(chords[0].digest)}
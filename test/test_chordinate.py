@@ -3,6 +3,7 @@ from music21.chord import Chord
 from music21.scale import ChromaticScale, MinorScale, MajorScale
 from numpy import inf
 from numpy import linalg as la
+import pickle
 from orbichord.chordinate import *
 
 # Define global variables
@@ -58,3 +59,16 @@ def test_EfficientVoiceLeading():
     )
     assert vl == [1, 1, 0, 1, 1, 0, 1]
     assert dist == 1.0
+
+
+def test_named_metrics():
+    """Test named metrics and pickling of EfficientVoiceLeading."""
+    assert euclideanNorm([3, -4]) == 5.0
+    assert taxicabNorm([3, -4]) == 7.0
+    assert maximumNorm([3, -4]) == 4.0
+    voice_leading = EfficientVoiceLeading(
+        scale = MajorScale('C'),
+        metric = maximumNorm
+    )
+    copy = pickle.loads(pickle.dumps(voice_leading))
+    assert copy(chord, Chord('G B D')) == voice_leading(chord, Chord('G B D'))
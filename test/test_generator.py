@@ -1,6 +1,25 @@
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+import itertools
+import pytest
+from orbichord.cache import mergeShards, readChunks
+from orbichord.chord import ChordRegistry
+from orbichord.chordinate import scalePoint
 from orbichord.generator import *
+from orbichord.identify import \
+    chordOPTC, \
+    chordOPTIC, \
+    chordOrderedPitchClasses, \
+    chordPitchClasses, \
+    chordPitchClassesCode, \
+    chordPitchClassSetCode, \
+    chordPitchNames, \
+    chordPrimeForm, \
+    chordSymbolIndex, \
+    chordTIClass
+from orbichord.selection import areTriads, haveChordSymbolFigure
 from orbichord.symbol import chordSymbolFigure
-from music21.scale import MajorScale
+from music21.scale import ChromaticScale, MajorScale
 
 reference_chords = {
     'Am',
@@ -65,3 +84,600 @@ def test_triad_Generator():
         )
     assert generated_chords <= reference_chords
     assert generated_chords >= reference_chords
+
+
+def test_canonical_Generator():
+    """Test Generator canonical enumeration of orbits."""
+    for pitches, dimension in (
+        (MajorScale('C').getPitches('C','B'), 3),
+        (ChromaticScale('C').getPitches('C','B'), 4)
+    ):
+        for identify in (
+            chordOrderedPitchClasses,
+            chordPitchClasses,
+            chordPitchNames,
+            chordSymbolIndex
+        ):
+            generators = [
+                Generator(
+                    pitches = pitches,
+                    dimension = dimension,
+                    identify = identify,
+                    canonical = canonical
+                ) for canonical in (False, True)
+            ]
+            vetoed, canonical = [
+                [chord.fullName for chord in generator.run()]
+                for generator in generators
+            ]
+            assert vetoed == canonical
+
+
+def test_canonical_Generator_errors():
+    """Test Generator canonical enumeration errors."""
+    scale = MajorScale('C')
+    with pytest.raises(ValueError):
+        Generator(
+            pitches = scale.getPitches('C','B'),
+            identify = lambda chord: chord.orderedPitchClassesString,
+            canonical = True
+        )
+    with pytest.raises(ValueError):
+        Generator(
+            pitches = scale.getPitches('C','B'),
+            combinator = itertools.permutations,
+            canonical = True
+        )
+    with pytest.raises(ValueError):
+        Generator(
+            pitches = scale.getPitches('C4','C5'),
+            canonical = True
+        )
+
+
+def test_compact_Generator():
+    """Test Generator compact chords."""
+    for pitches, dimension, canonical in (
+        (MajorScale('C').getPitches('C','B'), 3, False),
+        (MajorScale('E').getPitches('E3','E5'), 3, False),
+        (ChromaticScale('C').getPitches('C','B'), 4, True)
+    ):
+        for select in (hasChordSymbolFigure, lambda chord: chord.isTriad()):
+            generators = [
+                Generator(
+                    pitches = pitches,
+                    dimension = dimension,
+                    select = select,
+                    canonical = canonical,
+                    compact = compact
+                ) for compact in (False, True)
+            ]
+            chords, compact_chords = [
+                list(generator.run()) for generator in generators
+            ]
+            assert [chord.identity for chord in chords] ==\
+                [chord.identity for chord in compact_chords]
+            assert [chord.fullName for chord in chords] ==\
+                [chord.chord.fullName for chord in compact_chords]
+
+
+def test_sharded_Generator():
+    """Test Generator sharded generation."""
+    scale = MajorScale('C')
+    reference = [
+        chord.fullName for chord in Generator(
+            pitches = scale.getPitches('C','B')
+        ).run()
+    ]
+    chords = [
+        chord.fullName for chord in Generator(
+            pitches = scale.getPitches('C','B'),
+            workers = 2
+        ).run()
+    ]
+    assert chords == reference
+    with ThreadPoolExecutor(max_workers = 3) as executor:
+        for compact in (False, True):
+            chords = [
+                chord.fullName for chord in Generator(
+                    pitches = scale.getPitches('C','B'),
+                    select = lambda chord: hasChordSymbolFigure(chord),
+                    compact = compact,
+                    workers = 3,
+                    executor = executor
+                ).run()
+            ]
+            assert chords == reference
+
+
+def test_cached_Generator(tmp_path):
+    """Test Generator chord cache."""
+    scale = MajorScale('C')
+    reference = [
+        chord.fullName for chord in Generator(
+            pitches = scale.getPitches('C','B')
+        ).run()
+    ]
+    for compact in (False, True):
+        generator = Generator(
+            pitches = scale.getPitches('C','B'),
+            compact = compact,
+            cache = str(tmp_path)
+        )
+        for _ in range(2):
+            chords = [
+                chord.fullName if not compact else chord.chord.fullName
+                for chord in generator.run()
+            ]
+            assert chords == reference
+    assert len(list(tmp_path.iterdir())) == 1
+    with pytest.raises(ValueError):
+        Generator(
+            pitches = scale.getPitches('C','B'),
+            select = lambda chord: chord.isTriad(),
+            cache = str(tmp_path)
+        )
+
+
+def test_batch_select_Generator():
+    """Test Generator batch select."""
+    scale = MajorScale('C')
+    reference = [
+        chord.fullName for chord in Generator(
+            pitches = scale.getPitches('C','B'),
+            select = lambda chord: chord.isTriad()
+        ).run()
+    ]
+    for compact in (False, True):
+        chords = [
+            chord.fullName if not compact else chord.chord.fullName
+            for chord in Generator(
+                pitches = scale.getPitches('C','B'),
+                select = None,
+                batch_select = areTriads,
+                batch_size = 5,
+                compact = compact
+            ).run()
+        ]
+        assert chords == reference
+
+
+def test_memory_budget_Generator():
+    """Test Generator with a small memory budget."""
+    pitches = ChromaticScale('C').getPitches('C','B')
+    for identify in (chordPitchClasses, chordPitchNames):
+        generators = [
+            Generator(
+                pitches = pitches,
+                identify = identify,
+                memory_budget = memory_budget
+            ) for memory_budget in (None, 1000)
+        ]
+        reference, chords = [
+            [chord.fullName for chord in generator.run()]
+            for generator in generators
+        ]
+        assert chords == reference
+
+
+def test_count_Generator():
+    """Test Generator count and estimate."""
+    pitches = ChromaticScale('C').getPitches('C','B')
+    for dimension in (3, 4):
+        for identify in (chordOrderedPitchClasses, chordPitchNames):
+            generator = Generator(
+                pitches = pitches,
+                dimension = dimension,
+                identify = identify,
+                select = None
+            )
+            size = sum(1 for _ in generator.run())
+            assert generator.count() == size
+            assert generator.estimate() == (size, size, size, 0)
+    generator = Generator(pitches = pitches, dimension = 4)
+    size = sum(1 for _ in generator.run())
+    estimate = generator.estimate(samples = 2000, seed = 1)
+    assert estimate.lower <= size <= estimate.upper
+    assert estimate.samples == 2000
+    with pytest.raises(ValueError):
+        Generator(
+            pitches = pitches,
+            identify = lambda chord: chord.orderedPitchClassesString
+        ).count()
+
+
+def test_sample_Generator():
+    """Test Generator sampling."""
+    pitches = ChromaticScale('C').getPitches('C','B')
+    generator = Generator(pitches = pitches, dimension = 4, compact = True)
+    space = set(chord.identity for chord in generator.run())
+    reports = []
+    for weighted in (False, True):
+        chords = list(generator.sample(
+            100, seed = 1, weighted = weighted, report = reports.append
+        ))
+        assert len(chords) == 100
+        assert all(chord.identity in space for chord in chords)
+    assert all(report.selected == 100 for report in reports)
+    assert all(report.drawn >= 100 for report in reports)
+    chords = list(Generator(
+        pitches = pitches, select = lambda chord: False
+    ).sample(10, max_draws = 50, report = reports.append))
+    assert not chords
+    assert reports[-1].drawn == 50
+    # By default the number of draws is limited
+    chords = list(Generator(
+        pitches = pitches, select = lambda chord: False, compact = True
+    ).sample(1, report = reports.append))
+    assert not chords
+    assert reports[-1].drawn == SAMPLE_MAX_DRAWS_PER_CHORD
+    # Draws consumed by batch selection are reported
+    chords = list(Generator(
+        pitches = pitches, select = None, batch_select = haveChordSymbolFigure,
+        batch_size = 64
+    ).sample(1, seed = 1, report = reports.append))
+    assert len(chords) == 1 and reports[-1].drawn == 64
+
+
+def test_checkpointed_Generator(tmp_path):
+    """Test Generator checkpointed generation."""
+    pitches = ChromaticScale('C').getPitches('C','B')
+    reference = [
+        chord.fullName for chord in Generator(pitches = pitches).run()
+    ]
+    generator = Generator(pitches = pitches, compact = True)
+    chords = []
+    # Interrupt after the first chunk
+    for chord in generator.run_checkpointed(str(tmp_path), interval = 100):
+        chords.append(chord.chord.fullName)
+        break
+    chords += [
+        chord.chord.fullName for chord in
+        generator.run_checkpointed(str(tmp_path), interval = 100)
+    ]
+    stored = [
+        chord.fullName for chord in
+        readChunks(str(tmp_path), generator.identify)
+    ]
+    assert stored == reference
+    assert len(chords) < len(reference)
+    assert not list(generator.run_checkpointed(str(tmp_path)))
+    with pytest.raises(ValueError):
+        next(Generator(
+            pitches = pitches, select = lambda chord: True
+        ).run_checkpointed(str(tmp_path / 'lambda')))
+    for keywords in (
+        {'workers': 2},
+        {'executor': ThreadPoolExecutor(2)},
+        {'progress': print},
+        {'registry': ChordRegistry()}
+    ):
+        with pytest.raises(ValueError):
+            next(Generator(pitches = pitches, **keywords).run_checkpointed(
+                str(tmp_path / 'combined')
+            ))
+    with pytest.raises(ValueError):
+        next(Generator(
+            pitches = pitches, dimension = 4
+        ).run_checkpointed(str(tmp_path)))
+
+
+def test_run_batches_Generator():
+    """Test Generator batches of chords."""
+    scale = MajorScale('C')
+    for identify in (chordOrderedPitchClasses, chordPitchNames):
+        generator = Generator(
+            pitches = scale.getPitches('C','B'),
+            identify = identify,
+            compact = identify is chordPitchNames
+        )
+        chords = list(generator.run())
+        batches = list(generator.run_batches(batch_size = 10, scale = scale))
+        assert [len(batch.pitchClasses) for batch in batches[:-1]] == \
+            [10]*(len(batches) - 1)
+        pcs = [row for batch in batches for row in batch.pitchClasses.tolist()]
+        assert pcs == [list(chord.pitchClasses) for chord in chords]
+        octaves = [row for batch in batches for row in batch.octaves.tolist()]
+        assert octaves == [
+            [pitch.octave for pitch in chord.pitches] for chord in chords
+        ]
+        points = [
+            row for batch in batches for row in batch.scalePoints.tolist()
+        ]
+        assert points == [scalePoint(chord, scale) for chord in chords]
+    identities = [
+        identity for batch in batches for identity in batch.identities
+    ]
+    assert identities == [chord.identity for chord in chords]
+
+
+def test_arun_Generator():
+    """Test Generator asynchronous generation."""
+    scale = MajorScale('C')
+    generator = Generator(pitches = scale.getPitches('C','B'))
+    reference = [chord.fullName for chord in generator.run()]
+
+    async def consume(arrays):
+        batches = []
+        async for batch in generator.arun(batch_size = 4, arrays = arrays):
+            batches.append(batch)
+        return batches
+
+    batches = asyncio.run(consume(False))
+    assert all(len(batch) <= 4 for batch in batches)
+    assert [chord.fullName for batch in batches for chord in batch] == \
+        reference
+    batches = asyncio.run(consume(True))
+    assert sum(len(batch.pitchClasses) for batch in batches) == \
+        len(reference)
+
+    async def cancel():
+        task = asyncio.ensure_future(consume(False))
+        await asyncio.sleep(0)
+        task.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await task
+
+    asyncio.run(cancel())
+
+
+def test_EqualDivisionGenerator():
+    """Test EqualDivisionGenerator."""
+    chromatic = ChromaticScale('C')
+    generator = Generator(
+        pitches = chromatic.getPitches('C','B'),
+        identify = chordPitchClassSetCode,
+        select = lambda chord: True,
+        compact = True
+    )
+    reference = [chord.identity for chord in generator.run()]
+    generator = EqualDivisionGenerator(divisions = 12)
+    assert [chord.identity for chord in generator.run()] == reference
+
+    for divisions in (19, 24):
+        generator = EqualDivisionGenerator(divisions = divisions)
+        chords = list(generator.run())
+        assert len(chords) == generator.count()
+        assert len({chord.identity for chord in chords}) == len(chords)
+        canonical = EqualDivisionGenerator(
+            divisions = divisions, canonical = True
+        )
+        assert [chord.identity for chord in canonical.run()] == \
+            [chord.identity for chord in chords]
+
+    generator = EqualDivisionGenerator(
+        divisions = 24,
+        steps = range(18, 30),
+        dimension = 2,
+        identify = chordPitchClassesCode
+    )
+    chord = next(
+        chord for chord in generator.run() if chord.pitchClasses == (18, 2)
+    )
+    assert chord.octaves == (0, 1)
+    assert chord.chord.pitches[1].ps - chord.chord.pitches[0].ps == 4
+
+    with pytest.raises(ValueError):
+        EqualDivisionGenerator(divisions = 0)
+    for identify in (chordSymbolIndex, chordPitchClasses):
+        assert len(list(EqualDivisionGenerator(
+            divisions = 12, identify = identify
+        ).run())) > 0
+        with pytest.raises(ValueError):
+            EqualDivisionGenerator(divisions = 19, identify = identify)
+
+
+def test_ordered_Generator():
+    """Test Generator ordered generation."""
+    scale = MajorScale('C')
+    pitches = scale.getPitches('C','B')
+    for identify in (chordPitchNames, chordPitchClasses,
+        chordOrderedPitchClasses):
+        reference = Generator(
+            pitches = pitches,
+            combinator = lambda iterable, dimension: itertools.product(
+                iterable, repeat = dimension
+            ),
+            identify = identify,
+            select = lambda chord: chord.isTriad()
+        )
+        for compact in (False, True):
+            generator = Generator(
+                pitches = pitches,
+                identify = identify,
+                select = lambda chord: chord.isTriad(),
+                compact = compact,
+                ordered = True
+            )
+            assert [chord.fullName for chord in generator.run()] == \
+                [chord.fullName for chord in reference.run()]
+    generator = Generator(
+        pitches = pitches,
+        identify = chordPitchNames,
+        ordered = True
+    )
+    assert generator.count() == 7**3
+    assert len(list(generator.sample(5, seed = 1))) == 5
+    reference = Generator(
+        pitches = pitches,
+        identify = chordPitchNames,
+        combinator = itertools.product,
+        ordered = True
+    )
+    assert [chord.fullName for chord in reference.run()] == \
+        [chord.fullName for chord in generator.run()]
+    with pytest.raises(ValueError):
+        Generator(
+            pitches = pitches,
+            identify = chordSymbolIndex,
+            ordered = True
+        )
+    with pytest.raises(ValueError, match = 'itertools.product'):
+        Generator(
+            pitches = pitches,
+            identify = chordPitchNames,
+            combinator = itertools.permutations,
+            ordered = True
+        )
+
+
+def test_shard_Generator(tmp_path):
+    """Test Generator shards and merge of shard files."""
+    scale = MajorScale('C')
+    for identify, canonical in ((chordOrderedPitchClasses, False),
+        (chordOrderedPitchClasses, True), (chordSymbolIndex, False)):
+        arguments = dict(
+            pitches = scale.getPitches('C','B'),
+            identify = identify,
+            select = lambda chord: chord.isTriad() and \
+                chord.pitches[0].name != 'E',
+            canonical = canonical
+        )
+        reference = [
+            chord.fullName for chord in Generator(**arguments).run()
+        ]
+        paths = []
+        for shard_index in range(3):
+            path = str(tmp_path / '{}-{}.gz'.format(canonical, shard_index))
+            Generator(shard = (shard_index, 3), **arguments).write_shard(path)
+            paths.append(path)
+        chords = list(mergeShards(paths, identify))
+        assert [chord.fullName for chord in chords] == reference
+
+    reference = Generator(
+        pitches = scale.getPitches('C','B'), canonical = True
+    ).run()
+    chords = [
+        chord for shard_index in range(2) for chord in Generator(
+            pitches = scale.getPitches('C','B'),
+            canonical = True,
+            shard = (shard_index, 2)
+        ).run()
+    ]
+    assert sorted(chord.fullName for chord in chords) == \
+        sorted(chord.fullName for chord in reference)
+
+    with pytest.raises(ValueError):
+        Generator(pitches = scale.getPitches('C','B'), shard = (2, 2))
+    with pytest.raises(ValueError):
+        Generator(
+            pitches = scale.getPitches('C','B'), shard = (0, 2), workers = 2
+        )
+    with pytest.raises(ValueError):
+        Generator(pitches = scale.getPitches('C','B')).write_shard(
+            str(tmp_path / 'shard.gz')
+        )
+    with pytest.raises(ValueError):
+        next(Generator(
+            pitches = scale.getPitches('C','B'), shard = (0, 2)
+        ).run_checkpointed(str(tmp_path / 'checkpoint')))
+    with pytest.raises(ValueError):
+        EqualDivisionGenerator(divisions = 19, shard = (0, 2)).write_shard(
+            str(tmp_path / 'shard.gz')
+        )
+    with pytest.raises(ValueError):
+        EqualDivisionGenerator(divisions = 19).run_checkpointed(
+            str(tmp_path / 'checkpoint')
+        )
+
+
+def test_progress_Generator():
+    """Test Generator progress reports."""
+    scale = ChromaticScale('C')
+    reports = []
+    generator = Generator(
+        pitches = scale.getPitches('C','B'),
+        progress = reports.append,
+        progress_interval = 0
+    )
+    chords = list(generator.run())
+    reference = list(Generator(pitches = scale.getPitches('C','B')).run())
+    assert [chord.fullName for chord in chords] == \
+        [chord.fullName for chord in reference]
+    report = reports[-1]
+    assert report.done and len(reports) > 1
+    assert report.examined == report.total == 364
+    assert report.selected == len(chords)
+    assert report.examined == \
+        report.vetoed + report.rejected + report.selected
+    assert report.seconds >= report.combine_seconds + report.identify_seconds
+
+    reports = []
+    generator = Generator(
+        pitches = scale.getPitches('C','B'),
+        canonical = True,
+        shard = (0, 2),
+        progress = reports.append
+    )
+    chords = generator.run()
+    assert len(list(itertools.islice(chords, 3))) == 3
+    chords.close()
+    assert len(reports) == 1 and not reports[0].done
+    assert reports[0].total == 149 and reports[0].vetoed == 0
+
+    with pytest.raises(ValueError):
+        Generator(
+            pitches = scale.getPitches('C','B'),
+            progress = print,
+            workers = 2
+        )
+
+
+def test_registry_Generator():
+    """Test Generator with a chord registry."""
+    scale = MajorScale('C')
+    registry = ChordRegistry()
+    generator = Generator(
+        pitches = scale.getPitches('C','B'),
+        compact = True,
+        registry = registry
+    )
+    chords = list(generator.run())
+    assert all(a is b for a, b in zip(chords, generator.run()))
+    assert len(registry) == len(chords)
+    with pytest.raises(ValueError):
+        Generator(pitches = scale.getPitches('C','B'), registry = registry)
+
+
+def test_set_class_Generator():
+    """Test Generator with set class identities."""
+    scale = ChromaticScale('C')
+    generator = Generator(
+        pitches = scale.getPitches('C','B'),
+        identify = chordPrimeForm,
+        select = None,
+        compact = True
+    )
+    assert [str(chord.identity) for chord in generator.run()] == \
+        ['<0>', '<01>', '<02>', '<03>', '<04>', '<05>', '<06>',
+        '<012>', '<013>', '<014>', '<015>', '<016>', '<024>', '<025>',
+        '<026>', '<027>', '<036>', '<037>', '<048>']
+    generator = EqualDivisionGenerator(
+        divisions = 19,
+        identify = chordTIClass
+    )
+    assert len(list(generator.run())) == \
+        len({chordTIClass(chord) for chord in generator.run()})
+
+
+def test_orbit_Generator():
+    """Test Generator with orbit identities."""
+    scale = ChromaticScale('C')
+    generator = Generator(
+        pitches = scale.getPitches('C','B'),
+        identify = chordOPTIC,
+        select = None
+    )
+    chords = list(generator.run())
+    assert len(chords) == 19
+    assert len({chordPrimeForm(chord) for chord in chords}) == 19
+    batches = list(generator.run_batches(batch_size = 8))
+    assert [int(code) for batch in batches for code in batch.identities] == \
+        [chord.identity for chord in chords]
+    generator = EqualDivisionGenerator(
+        divisions = 19,
+        dimension = 4,
+        identify = chordOPTC
+    )
+    assert len(list(generator.run())) == \
+        len({chordOPTC(chord) for chord in generator.run()})
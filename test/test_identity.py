@@ -1,5 +1,9 @@
 
 from music21.chord import Chord
+import itertools
+import numpy
+import pickle
+import pytest
 from orbichord.identify import *
 
 
@@ -34,3 +38,131 @@ def test_chordSymbolIndex():
     assert chordSymbolIndex(Chord('D# B G')) == '<37B>'
     assert chordSymbolIndex(Chord('G B D#')) == '<73B>'
     assert chordSymbolIndex(Chord('G D# B')) == '<73B>'
+
+
+def test_IdentityCode():
+    """Test IdentityCode orbichord.identity module classes."""
+    chord = Chord('E C G E')
+    identities = [
+        (chordPitchClassSetCode, chordOrderedPitchClasses, 145),
+        (chordPitchClassesCode, chordPitchClasses, int('14074', 12)),
+        (chordSymbolIndexCode, chordSymbolIndex, 4*4096 + 129)
+    ]
+    for identify, identify_string, code in identities:
+        identity = identify(chord)
+        assert isinstance(identity, IdentityCode)
+        assert identity == code and hash(identity) == hash(code)
+        assert str(identity) == identify_string(chord)
+        assert pickle.loads(pickle.dumps(identity)) == identity
+    identity = identityCode(PitchClassesIdentity, int('1D5', 24), 24)
+    assert identity.pitchClasses() == [13, 5]
+    assert str(identity) == '<D5>'
+    identity = pickle.loads(pickle.dumps(identity))
+    assert identity.divisions == 24 and str(identity) == '<D5>'
+
+    # Codes of different kinds or divisions are different
+    codes = [
+        identityCode(PitchClassSetIdentity, 145),
+        identityCode(PitchClassesIdentity, 145),
+        identityCode(PitchClassSetIdentity, 145, 19),
+        identityCode(OrbitIdentity, 145, 12, 'PT'),
+        identityCode(OrbitIdentity, 145, 12, 'PTI')
+    ]
+    assert len(set(codes)) == len(codes)
+    assert all(code == 145 for code in codes)
+    assert codes[0] != codes[1] and not codes[0] == codes[1]
+    assert chordTClass(Chord('C E G')) != \
+        chordPitchClassSetCode(Chord('C D# G#'))
+    assert chordOPT(Chord('C E G')) != chordOPTI(Chord('C E G'))
+    for code in codes:
+        assert pickle.loads(pickle.dumps(code)) == code
+    assert IdentityCode.__abstractmethods__ == {'pitchClasses'}
+
+    # More than 36 divisions
+    identity = identityCode(PitchClassSetIdentity, (1 << 40) | 1, 53)
+    assert str(identity) == '<0.40>'
+    assert pitchClassSetCodes([[0, 40]], 53, strings = True).tolist() == \
+        ['<0.40>']
+
+
+def test_batch_identities():
+    """Test batch identity functions of orbichord.identity module."""
+    pcs = numpy.array([[0, 4, 7], [7, 4, 0], [4, 0, 7], [1, 1, 8]])
+    chords = [Chord(row.tolist()) for row in pcs]
+    batches = [
+        (pitchClassSetCodes, chordPitchClassSetCode, chordOrderedPitchClasses),
+        (pitchClassesCodes, chordPitchClassesCode, chordPitchClasses),
+        (symbolIndexCodes, chordSymbolIndexCode, chordSymbolIndex),
+        (pitchNamesCodes, chordPitchClassesCode, chordPitchNames)
+    ]
+    for batch, identify_code, identify_string in batches:
+        assert batch(pcs).tolist() == \
+            [identify_code(chord) for chord in chords]
+        assert batch(pcs, strings = True).tolist() == \
+            [identify_string(chord) for chord in chords]
+    assert pitchClassesCodes([[0, 13]], 24).tolist() == [24*24 + 13]
+    with pytest.raises(ValueError):
+        pitchClassesCodes(numpy.zeros((1, 20), dtype=int))
+
+
+def test_set_class_identities():
+    """Test set class identities of orbichord.identity module."""
+    def string(pcs):
+        return '<' + ''.join(map(base10toN, pcs)) + '>'
+
+    for mask in range(1, 4096, 61):
+        chord = Chord([pc for pc in range(12) if mask >> pc & 1])
+        assert chordNormalForm(chord) == string(chord.normalOrder)
+        assert chordPrimeForm(chord) == string(chord.primeForm)
+        assert chordForteClass(chord) == chord.forteClassTnI
+        assert chordIntervalVector(chord) == string(chord.intervalVector)
+        assert str(chordTIClass(chord)) == chordPrimeForm(chord)
+    assert chordTClass(Chord('C E G')) != chordTClass(Chord('C E- G'))
+    assert chordTIClass(Chord('C E G')) == chordTIClass(Chord('C E- G'))
+    assert tiClassCodes([[0, 4, 7], [0, 3, 7]]).tolist() == [137, 137]
+
+    # Invariance for other equal divisions of the octave
+    pcs = numpy.array([[0, 5, 11], [3, 16, 2]])
+    for divisions in (17, 19):
+        for transposition in range(divisions):
+            transposed = (pcs + transposition) % divisions
+            inverted = (-pcs + transposition) % divisions
+            assert (tClassCodes(transposed, divisions) == \
+                tClassCodes(pcs, divisions)).all()
+            assert (tiClassCodes(inverted, divisions) == \
+                tiClassCodes(pcs, divisions)).all()
+    with pytest.raises(ValueError):
+        tiClassCode([0, 5, 11], 24)
+
+
+def test_orbit_identities():
+    """Test orbit identities of orbichord.identity module."""
+    chords = numpy.array(list(itertools.product(range(12), repeat = 3)))
+    # Orbits agree with the set classes
+    for symmetries, codes in (('OPTC', tClassCodes), ('OPTIC', tiClassCodes)):
+        orbits = orbitCodes(chords, 12, symmetries)
+        pairs = set(zip(orbits.tolist(), codes(chords).tolist()))
+        assert len(pairs) == len(set(orbits.tolist())) == \
+            len(set(codes(chords).tolist()))
+    # Known number of orbits
+    assert len(numpy.unique(orbitLabels(12, 3, 'OT'))) == 144
+    assert len(numpy.unique(orbitLabels(12, 3, 'OPT'))) == 31
+    assert len(numpy.unique(orbitLabels(12, 4, 'OPTIC'))) == 48
+    # Invariance for other equal divisions of the octave
+    pcs = numpy.array([[0, 5, 11], [3, 16, 2]])
+    for transposition in range(19):
+        transposed = (pcs + transposition) % 19
+        inverted = (-pcs[:, ::-1] + transposition) % 19
+        assert (orbitCodes(transposed, 19, 'OT') ==
+            orbitCodes(pcs, 19, 'OT')).all()
+        assert (orbitCodes(inverted, 19, 'OPTI') ==
+            orbitCodes(pcs, 19, 'OPTI')).all()
+    # Chord identities
+    assert str(chordOPTIC(Chord('E G C'))) == '<037>'
+    assert str(chordOPTI(Chord('C C E'))) == '<004>'
+    assert str(chordOT(Chord('E G C'))) == '<038>'
+    assert chordOPTC(Chord('C C E')) == chordOPTC(Chord('C E E'))
+    assert chordOPT(Chord('C C E')) != chordOPT(Chord('C E E'))
+    assert chordOPTI(Chord('C C E')) == chordOPTI(Chord('C E E'))
+    with pytest.raises(ValueError):
+        orbitLabels(12, 3, 'OC')
@@ -0,0 +1,53 @@
+from itertools import combinations_with_replacement
+from music21.chord import Chord
+from music21.scale import ChromaticScale
+import numpy
+from orbichord.selection import *
+from orbichord.symbol import hasChordSymbolFigure
+
+
+def test_pitchClassMasks():
+    """Test pitchClassMasks orbichord.selection module method."""
+    masks = pitchClassMasks([[0, 4, 7], [4, 7, 0], [11, 11, 11]])
+    assert masks.tolist() == [145, 145, 2048]
+
+
+def test_areTriads():
+    """Test areTriads orbichord.selection module method."""
+    mask = areTriads([[0, 4, 7], [2, 5, 9], [11, 2, 5], [0, 4, 8], [0, 2, 7]])
+    assert mask.tolist() == [True, True, True, True, False]
+
+
+def test_areSevenths():
+    """Test areSevenths orbichord.selection module method."""
+    mask = areSevenths([[7, 11, 2, 5], [0, 4, 7, 11], [0, 4, 7, 7]])
+    assert mask.tolist() == [True, True, False]
+
+
+def test_haveChordSymbolFigure():
+    """Test haveChordSymbolFigure orbichord.selection module method."""
+    pitches = ChromaticScale('C').getPitches('C', 'B')
+    pcs = []
+    reference = []
+    for ntuple in combinations_with_replacement(pitches, 3):
+        chord = Chord(ntuple)
+        pcs.append(chord.pitchClasses)
+        reference.append(hasChordSymbolFigure(chord))
+    assert haveChordSymbolFigure(numpy.array(pcs)).tolist() == reference
+
+
+def test_intervalVectors():
+    """Test intervalVectors orbichord.selection module method."""
+    vectors = intervalVectors([[0, 4, 7], [0, 3, 6]])
+    assert vectors.tolist() == [[0, 0, 1, 1, 1, 0], [0, 0, 2, 0, 0, 1]]
+    vectors = intervalVectors([[0, 3, 6, 9]])
+    assert vectors.tolist() == [[0, 0, 4, 0, 0, 2]]
+
+
+def test_select_factories():
+    """Test orbichord.selection module function factories."""
+    pcs = [[0, 4, 7], [0, 0, 7], [0, 3, 6]]
+    assert haveCardinality(3)(pcs).tolist() == [True, False, True]
+    assert haveIntervalVector([0, 0, 1, 1, 1, 0])(pcs).tolist() == \
+        [True, False, False]
+    assert haveIntervalClass(6)(pcs).tolist() == [False, False, True]
@@ -0,0 +1,80 @@
+from music21.chord import Chord
+from orbichord.identify import \
+    chordOrderedPitchClasses, \
+    chordPitchClassesCode, \
+    chordPitchNames
+from orbichord.store import *
+
+
+def test_SetStore():
+    """Test SetStore orbichord.store module class."""
+    store = SetStore()
+    assert store.add('<047>')
+    assert not store.add('<047>')
+    assert store.add('<037>')
+    assert '<037>' in store
+    assert len(store) == 2
+
+
+def test_BitsetStore():
+    """Test BitsetStore orbichord.store module class."""
+    store = BitsetStore(4096)
+    keys = [0, 7, 145, 4095, 145, 0]
+    assert [store.add(key) for key in keys] == \
+        [True, True, True, True, False, False]
+    assert 4095 in store
+    assert 8 not in store
+    assert len(store) == 4
+
+
+def test_IntegerStore():
+    """Test IntegerStore orbichord.store module class."""
+    store = IntegerStore(capacity = 2)
+    keys = [0, 1 << 60, 145, 7, 145, 0] + list(range(1000, 2000, 3))
+    assert [store.add(key) for key in keys[:6]] == \
+        [True, True, True, True, False, False]
+    assert all(store.add(key) for key in keys[6:])
+    assert all(key in store for key in keys)
+    assert 8 not in store and 1001 not in store
+    assert len(store) == len(set(keys)) == len(list(store))
+
+
+def test_SpillStore(tmp_path):
+    """Test SpillStore orbichord.store module class."""
+    store = SpillStore(capacity = 10, directory = str(tmp_path))
+    keys = ['<{}>'.format(key) for key in range(100)]
+    assert all(store.add(key) for key in keys)
+    assert store.spilled
+    assert not any(store.add(key) for key in keys)
+    assert all(key in store for key in keys)
+    assert '<100>' not in store
+    assert len(store) == 100
+    store.close()
+    assert not list(tmp_path.iterdir())
+
+
+def test_identityStore():
+    """Test identityStore orbichord.store module function."""
+    _, store = identityStore(chordOrderedPitchClasses, 3)
+    assert isinstance(store, BitsetStore)
+    _, store = identityStore(chordPitchNames, 3)
+    assert isinstance(store, SetStore)
+    _, store = identityStore(chordPitchNames, 3, memory_budget = 1000)
+    assert isinstance(store, SpillStore)
+    _, store = identityStore(chordPitchClassesCode, 20)
+    assert isinstance(store, IntegerStore)
+    # Keys in memory and the Bloom filter share the memory budget
+    _, store = identityStore(chordPitchNames, 3, memory_budget = 1000)
+    assert store._capacity == 5
+    for key in range(6):
+        store.add(str(key))
+    assert store.spilled and len(store._bloom) == 500
+    _, store = identityStore(
+        chordPitchClassesCode, 20, memory_budget = 1000
+    )
+    assert isinstance(store, SpillStore) and store._capacity == 15
+    codes = [chordPitchClassesCode(Chord([pc])) for pc in range(12)]
+    assert all(store.add(code) for code in codes + list(range(100, 120)))
+    assert store.spilled
+    assert not any(store.add(code) for code in codes + list(range(100, 120)))
+    store.close()
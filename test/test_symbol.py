@@ -1,5 +1,10 @@
 from music21.chord import Chord
 from music21.harmony import ChordSymbol
+import numpy
+import os
+import pytest
+from orbichord.identify import symbolIndexCode
+from orbichord.maps import *
 from orbichord.symbol import *
 
 
@@ -50,3 +55,43 @@ def test_chordSymbolFigure():
     chord = Chord('F# D# B')
     assert chordSymbolFigure(chord) == 'B/F#'
     assert chordSymbolFigure(chord, inversion=0) == 'B'
+
+
+def test_SymbolFigureMap(tmp_path):
+    """Test SymbolFigureMap orbichord.maps module class."""
+    items = [
+        ('<047>', [['C'], ['<047>', '<407>', '<704>']]),
+        ('<407>', [['C/E'], ['<047>', '<407>', '<704>']]),
+        ('<704>', [['C/G'], ['<047>', '<407>', '<704>']]),
+        ('<509>', [['F', 'F/C'], ['<509>', '<905>', '<059>']])
+    ]
+    path = os.path.join(tmp_path, 'maps.bin')
+    writeSymbolFigureMap(path, items)
+    figures = SymbolFigureMap(path)
+    assert figures._codes is None
+    assert figures.inversions(symbolIndexCode([4, 0, 7])) == \
+        [symbolIndexCode(pcs) for pcs in ([0, 4, 7], [4, 0, 7], [7, 0, 4])]
+    figures = SymbolFigureMap(path)
+    assert figures._codes is None
+    assert list(figures.items()) == items
+    assert len(figures) == 4
+    assert '<509>' in figures and '<590>' not in figures
+    assert figures.get('<059>') is None and figures.get('C') is None
+    assert len(SYMBOL_INDEX_TO_FIGURE) == 9620
+    assert SYMBOL_INDEX_TO_FIGURE['<509>'] == items[3][1]
+
+
+def test_chordSymbolCodeFigure():
+    """Test integer chord symbol functions of orbichord.symbol module."""
+    code = symbolIndexCode([7, 0, 4])
+    assert hasChordSymbolCode(code) == True
+    assert hasChordSymbolCode(numpy.int64(code)) == True
+    assert hasChordSymbolCode(1) == False
+    assert hasChordSymbolCode(-1) == False
+    assert chordSymbolCodeFigure(code) == 'C/G'
+    assert chordSymbolCodeFigure(code, inversion=1) == 'C/E'
+    assert SYMBOL_INDEX_TO_FIGURE[code] == SYMBOL_INDEX_TO_FIGURE['<704>']
+    assert SYMBOL_INDEX_TO_FIGURE.inversions('<704>') == \
+        [symbolIndexCode(pcs) for pcs in ([0, 4, 7], [4, 0, 7], [7, 0, 4])]
+    with pytest.raises(KeyError):
+        chordSymbolCodeFigure(1)